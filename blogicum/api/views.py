@@ -0,0 +1,128 @@
+import hashlib
+import json
+from urllib.parse import urlencode
+
+from django.core.files.storage import default_storage
+from django.core.paginator import InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.views.decorators.http import require_safe
+
+from blog.constants import NUMBER_OF_COMMENTS, NUMBER_OF_POSTS
+from blog.models import Category, Comment, Post, User
+from blog.paginators import CursorPaginator
+
+POST_FIELDS = ('id', 'title', 'pub_date', 'updated_at', 'comment_count',
+               'image')
+POST_RELATED_FIELDS = {
+    'author__username': 'author',
+    'category__slug': 'category',
+    'location__name': 'location',
+}
+
+
+def get_post_values(queryset, *fields):
+    return queryset.values(*POST_FIELDS, *fields, *POST_RELATED_FIELDS)
+
+
+def serialize_post(post):
+    for lookup, name in POST_RELATED_FIELDS.items():
+        post[name] = post.pop(lookup)
+    post['image'] = (
+        default_storage.url(post['image']) if post['image'] else None
+    )
+    return post
+
+
+def json_response(request, data):
+    body = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False)
+    response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = f'"{hashlib.md5(response.content).hexdigest()}"'
+    return get_conditional_response(
+        request, etag=response['ETag'], response=response
+    )
+
+
+def get_cursor_url(request, cursor):
+    if cursor is None:
+        return None
+    return request.build_absolute_uri(
+        f'{request.path}?{urlencode({"cursor": cursor})}'
+    )
+
+
+def paginated_response(request, queryset, **extra):
+    paginator = CursorPaginator(get_post_values(queryset), NUMBER_OF_POSTS)
+    try:
+        page = paginator.page(request.GET.get('cursor'))
+    except InvalidPage as e:
+        raise Http404(str(e))
+    posts = [serialize_post(post) for post in page]
+    return json_response(request, {
+        **extra,
+        'results': posts,
+        'next': get_cursor_url(request, page.next_cursor),
+        'previous': get_cursor_url(request, page.previous_cursor),
+    })
+
+
+@require_safe
+def post_list(request):
+    return paginated_response(request, Post.objects.filter_posts())
+
+
+@require_safe
+def category_posts(request, category_slug):
+    category = Category.objects.filter(
+        slug=category_slug, is_published=True
+    ).values('title', 'slug', 'description').first()
+    if category is None:
+        raise Http404('Категория не найдена.')
+    return paginated_response(
+        request,
+        Post.objects.filter_posts().filter(category__slug=category_slug),
+        category=category
+    )
+
+
+@require_safe
+def profile(request, username):
+    author = User.objects.filter(username=username).values(
+        'username', 'first_name', 'last_name', 'date_joined'
+    ).first()
+    if author is None:
+        raise Http404('Пользователь не найден.')
+    posts = Post.objects.filter(author__username=username)
+    if request.user.username != username:
+        posts = posts.filter_posts()
+    return paginated_response(request, posts, profile=author)
+
+
+@require_safe
+def post_detail(request, post_id):
+    post = get_post_values(
+        Post.objects.filter(pk=post_id).visible_to(request.user), 'text'
+    ).first()
+    if post is None:
+        raise Http404('Публикация не найдена.')
+    try:
+        number = max(int(request.GET.get('comments_page', 1)), 1)
+    except ValueError:
+        number = 1
+    offset = (number - 1) * NUMBER_OF_COMMENTS
+    post['comments'] = list(Comment.objects.filter(
+        post_id=post_id
+    ).order_by('created_at', 'id').values(
+        'id', 'text', 'created_at', 'author__username'
+    )[offset:offset + NUMBER_OF_COMMENTS])
+    for comment in post['comments']:
+        comment['author'] = comment.pop('author__username')
+    post['comments_next'] = request.build_absolute_uri(
+        f'{request.path}?{urlencode({"comments_page": number + 1})}'
+    ) if offset + NUMBER_OF_COMMENTS < post['comment_count'] else None
+    return json_response(request, serialize_post(post))
+
+
+for view in (post_list, category_posts, profile, post_detail):
+    view.use_read_replica = True
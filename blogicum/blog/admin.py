@@ -1,14 +1,40 @@
 from django.contrib import admin
+from django.http import StreamingHttpResponse
 
+from .exports import iter_export, iter_gzip
 from .models import Category, Post, Location, Comment
 
 
+def export_response(queryset, kind, export_format):
+    response = StreamingHttpResponse(
+        iter_gzip(iter_export(queryset, kind, export_format)),
+        content_type='application/gzip'
+    )
+    response['Content-Disposition'] = (
+        f'attachment; filename="{kind}.{export_format}.gz"'
+    )
+    return response
+
+
+def make_export_actions(kind):
+    @admin.action(description='Выгрузить выбранные в CSV')
+    def export_csv(modeladmin, request, queryset):
+        return export_response(queryset, kind, 'csv')
+
+    @admin.action(description='Выгрузить выбранные в JSONL')
+    def export_jsonl(modeladmin, request, queryset):
+        return export_response(queryset, kind, 'jsonl')
+
+    return (export_csv, export_jsonl)
+
+
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
     list_display = (
         'title',
         'category',
         'is_published',
+        'comment_count',
     )
     list_editable = (
         'category',
@@ -17,6 +43,7 @@ class PostAdmin(admin.ModelAdmin):
     list_display_links = (
         'title',
     )
+    actions = make_export_actions('posts')
 
 
 @admin.register(Category)
@@ -47,3 +74,11 @@ class CommentAdmin(admin.ModelAdmin):
         'created_at',
         'author',
     )
+    actions = make_export_actions('comments')
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change and 'post' in form.changed_data:
+            Post.objects.filter(
+                pk__in=(form.initial['post'], obj.post_id)
+            ).recount_comments()
@@ -0,0 +1,224 @@
+import asyncio
+from functools import partial, wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import InvalidPage
+from django.db import close_old_connections
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.template.response import TemplateResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from metrics.middleware import track_queries
+
+from .cache import (
+    POSTS_TAG, SITE_TAG, cache_response, category_tag, get_page_cache_key,
+    get_page_etag, post_tag, profile_tag, set_page_etag
+)
+from .catalog import catalog
+from .constants import NUMBER_OF_COMMENTS, NUMBER_OF_POSTS
+from .forms import CommentForm
+from .models import Comment, Post
+from .profiles import get_profile
+from .paginators import (
+    CachedCountPaginator, CursorPaginator, KnownCountPaginator
+)
+
+
+def run_in_thread(func):
+    """Выполняет запрос в отдельном потоке со своим соединением с базой.
+
+    Запросы попадают в счётчик MetricsMiddleware текущего запроса.
+    """
+    def inner():
+        close_old_connections()
+        try:
+            with track_queries():
+                return func()
+        finally:
+            close_old_connections()
+    return sync_to_async(inner, thread_sensitive=False)()
+
+
+async def gather(*funcs):
+    return await asyncio.gather(*map(run_in_thread, funcs))
+
+
+async def resolve_user(request):
+    await sync_to_async(lambda: request.user.is_authenticated)()
+    return request.user
+
+
+def get_page_number(request):
+    try:
+        number = int(request.GET.get('page') or 1)
+    except ValueError:
+        raise Http404('Страница не найдена.')
+    if number < 1:
+        raise Http404('Страница не найдена.')
+    return number
+
+
+def get_cursor_page(paginator, cursor):
+    try:
+        return paginator.page(cursor)
+    except InvalidPage as e:
+        raise Http404(str(e))
+
+
+async def get_page(request, queryset, *lookups):
+    if settings.BLOG_CURSOR_PAGINATION:
+        paginator = CursorPaginator(queryset, NUMBER_OF_POSTS)
+        page, *results = await gather(
+            partial(get_cursor_page, paginator, request.GET.get('cursor')),
+            *lookups
+        )
+        return page, results
+    number = get_page_number(request)
+    offset = (number - 1) * NUMBER_OF_POSTS
+    paginator = CachedCountPaginator(queryset, NUMBER_OF_POSTS)
+    _, posts, *results = await gather(
+        lambda: paginator.count,
+        lambda: list(queryset[offset:offset + NUMBER_OF_POSTS + 1]),
+        *lookups
+    )
+    try:
+        return paginator.page_with(number, posts), results
+    except InvalidPage as e:
+        raise Http404(str(e))
+
+
+def get_list_context(page, **kwargs):
+    return {
+        'paginator': page.paginator,
+        'page_obj': page,
+        'is_paginated': page.has_other_pages(),
+        'object_list': page.object_list,
+        'post_list': page.object_list,
+        **kwargs,
+    }
+
+
+def cached_page(get_tags):
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, **kwargs):
+            user = await resolve_user(request)
+            if request.method not in ('GET', 'HEAD'):
+                return await view(request, **kwargs)
+            if user.is_authenticated:
+                response = await view(request, **kwargs)
+                patch_cache_control(response, private=True)
+                return response
+            tags = get_tags(**kwargs)
+            etag = await sync_to_async(get_page_etag)(request, tags)
+            response = get_conditional_response(request, etag=etag)
+            if response is not None:
+                return response
+            if request.method != 'GET':
+                return set_page_etag(await view(request, **kwargs), etag)
+            key = await sync_to_async(get_page_cache_key)(
+                request,
+                request.resolver_match.view_name,
+                [SITE_TAG, *tags]
+            )
+            response = await sync_to_async(cache.get)(key)
+            if response is None:
+                response = await view(request, **kwargs)
+                if response.status_code == 200 and not response.cookies:
+                    await sync_to_async(cache_response)(key, response)
+            return set_page_etag(response, etag)
+        return wrapper
+    return decorator
+
+
+@cached_page(lambda: [POSTS_TAG])
+async def post_list(request):
+    page, _ = await get_page(
+        request, Post.objects.get_comments_count().filter_posts()
+    )
+    return TemplateResponse(
+        request, 'blog/index.html', get_list_context(page)
+    )
+
+
+@cached_page(lambda category_slug: [category_tag(category_slug)])
+async def category_posts(request, category_slug):
+    category = await sync_to_async(catalog.get_published_category)(
+        category_slug
+    )
+    if category is None:
+        raise Http404('Категория не найдена.')
+    page, _ = await get_page(
+        request,
+        Post.objects.get_comments_count().filter_posts().filter(
+            category=category
+        )
+    )
+    return TemplateResponse(
+        request,
+        'blog/category.html',
+        get_list_context(page, category=category)
+    )
+
+
+@cached_page(lambda username: [profile_tag(username)])
+async def profile(request, username):
+    user = await resolve_user(request)
+    if user.get_username() == username:
+        author = user
+    else:
+        author = await sync_to_async(get_profile)(username)
+    if author is None:
+        raise Http404('Пользователь не найден.')
+    posts = author.posts.get_comments_count()
+    if user.username != username:
+        posts = posts.filter_posts()
+    page, _ = await get_page(request, posts)
+    return TemplateResponse(
+        request, 'blog/profile.html', get_list_context(page, profile=author)
+    )
+
+
+def get_comments_number(request):
+    try:
+        return max(int(request.GET.get('comments_page')), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+@cached_page(lambda post_id: [post_tag(post_id)])
+async def post_detail(request, post_id):
+    user = await resolve_user(request)
+    comments = Comment.objects.filter(
+        post_id=post_id
+    ).select_related('author').order_by('created_at', 'id')
+    number = get_comments_number(request)
+    offset = (number - 1) * NUMBER_OF_COMMENTS
+    post, page_comments = await gather(
+        partial(
+            get_object_or_404,
+            Post.objects.get_comments_count().visible_to(user),
+            pk=post_id
+        ),
+        lambda: list(comments[offset:offset + NUMBER_OF_COMMENTS])
+    )
+    paginator = KnownCountPaginator(
+        comments, NUMBER_OF_COMMENTS, post.comment_count
+    )
+    if number > paginator.num_pages:
+        page = await run_in_thread(partial(paginator.get_page, number))
+    else:
+        page = paginator.page_with(number, page_comments)
+    return TemplateResponse(request, 'blog/post_detail.html', {
+        'object': post,
+        'post': post,
+        'form': CommentForm(),
+        'comments': page,
+    })
+
+
+for view in (post_list, category_posts, profile, post_detail):
+    view.use_read_replica = True
@@ -0,0 +1,82 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import quote_etag
+
+TAG_KEY = 'blog:tag:{}'
+PAGE_KEY = 'blog:page:{}:{}'
+SITE_TAG = 'site'
+POSTS_TAG = 'posts'
+CATALOG_TAG = 'catalog'
+
+
+def post_tag(post_id):
+    return f'post:{post_id}'
+
+
+def category_tag(slug):
+    return f'category:{slug}'
+
+
+def profile_tag(username):
+    return f'profile:{username}'
+
+
+def get_tag_versions(tags):
+    keys = [TAG_KEY.format(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return [str(versions[key]) for key in keys]
+
+
+def invalidate(*tags):
+    cache.set_many(
+        {TAG_KEY.format(tag): time.time_ns() for tag in tags}, None
+    )
+
+
+def get_page_cache_key(request, view_name, tags):
+    versions = get_tag_versions(tags)
+    digest = hashlib.md5(
+        '|'.join([request.get_full_path(), *versions]).encode()
+    ).hexdigest()
+    return PAGE_KEY.format(view_name, digest)
+
+
+def get_page_etag(request, tags):
+    versions = get_tag_versions([SITE_TAG, *tags])
+    digest = hashlib.md5(
+        '|'.join([request.get_full_path(), *versions]).encode()
+    ).hexdigest()
+    return quote_etag(digest)
+
+
+def set_page_etag(response, etag):
+    if response.status_code == 200:
+        response.setdefault('ETag', etag)
+    return response
+
+
+def get_post_tags(post):
+    tags = [POSTS_TAG, post_tag(post.pk), profile_tag(post.author.username)]
+    if post.category_id:
+        tags.append(category_tag(post.category.slug))
+    return tags
+
+
+def invalidate_posts(posts):
+    invalidate(*{tag for post in posts for tag in get_post_tags(post)})
+
+
+def cache_response(key, response):
+    if hasattr(response, 'render') and not response.is_rendered:
+        response.add_post_render_callback(
+            lambda rendered: cache_response(key, rendered)
+        )
+        return
+    cache.set(key, response, settings.BLOG_PAGE_CACHE_TIMEOUT)
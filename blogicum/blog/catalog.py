@@ -0,0 +1,93 @@
+import threading
+import time
+
+from django.conf import settings
+
+from .cache import CATALOG_TAG, get_tag_versions
+from .models import Category, Location, Post
+
+CATEGORY_FIELD = Post._meta.get_field('category')
+LOCATION_FIELD = Post._meta.get_field('location')
+MISSING_SLUGS_LIMIT = 1000
+
+
+class Catalog:
+    """Категории и местоположения, загруженные в память процесса.
+
+    Сигналы сбрасывают каталог в текущем процессе, а версия тега
+    CATALOG_TAG в общем кеше — в остальных, не чаще раза
+    в BLOG_CATALOG_CHECK_INTERVAL секунд.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = None
+        self._version = None
+        self._checked_at = 0
+
+    def load(self):
+        categories = list(Category.objects.all())
+        return {
+            'categories': {category.pk: category for category in categories},
+            'slugs': {category.slug: category for category in categories},
+            'missing': set(),
+            'locations': {
+                location.pk: location for location in Location.objects.all()
+            },
+        }
+
+    def get_data(self):
+        now = time.monotonic()
+        with self._lock:
+            data, version = self._data, self._version
+            if (
+                data is not None
+                and now - self._checked_at
+                < settings.BLOG_CATALOG_CHECK_INTERVAL
+            ):
+                return data
+        current = get_tag_versions([CATALOG_TAG])[0]
+        if data is None or current != version:
+            data = self.load()
+        with self._lock:
+            self._data, self._version, self._checked_at = data, current, now
+        return data
+
+    def invalidate(self):
+        with self._lock:
+            self._data = None
+
+    def get_category(self, pk):
+        return self.get_data()['categories'].get(pk)
+
+    def get_category_by_slug(self, slug):
+        return self.get_data()['slugs'].get(slug)
+
+    def get_published_category(self, slug):
+        data = self.get_data()
+        category = data['slugs'].get(slug)
+        if category is None and slug not in data['missing']:
+            category = Category.objects.filter(slug=slug).first()
+            if category is None:
+                if len(data['missing']) >= MISSING_SLUGS_LIMIT:
+                    data['missing'].clear()
+                data['missing'].add(slug)
+        if category is None or not category.is_published:
+            return None
+        return category
+
+    def get_location(self, pk):
+        return self.get_data()['locations'].get(pk)
+
+    def attach(self, posts):
+        data = self.get_data()
+        for post in posts:
+            category = data['categories'].get(post.category_id)
+            if category is not None:
+                CATEGORY_FIELD.set_cached_value(post, category)
+            location = data['locations'].get(post.location_id)
+            if location is not None:
+                LOCATION_FIELD.set_cached_value(post, location)
+
+
+catalog = Catalog()
@@ -1,3 +1,19 @@
 FILDS_MAX_LENGHT = 256
 STR_LENGHT = 20
 NUMBER_OF_POSTS = 10
+NUMBER_OF_COMMENTS = 50
+PAGINATOR_ON_EACH_SIDE = 2
+PAGINATOR_ON_ENDS = 1
+IMAGE_VARIANT_WIDTHS = {
+    'card': 640,
+    'detail': 1280,
+}
+IMAGE_SRCSET_WIDTHS = (320, 640, 960, 1280)
+IMAGE_VARIANTS_DIR = 'variants'
+SEARCH_TERM_MAX_LENGTH = 64
+SEARCH_RESULTS_LIMIT = 200
+SEARCH_TITLE_WEIGHT = 10
+SEARCH_INDEX_BATCH_SIZE = 1000
+SEARCH_DOCUMENTS_TIMEOUT = 300
+FEED_ITEMS = 20
+FEED_EXCERPT_LENGTH = 300
@@ -0,0 +1,69 @@
+import csv
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import Comment, Post
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FIELDS = {
+    'posts': (
+        'id', 'title', 'text', 'pub_date', 'is_published', 'created_at',
+        'author__username', 'category__slug', 'location__name',
+        'comment_count',
+    ),
+    'comments': (
+        'id', 'post_id', 'author__username', 'text', 'created_at',
+    ),
+}
+EXPORT_MODELS = {
+    'posts': Post,
+    'comments': Comment,
+}
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def iter_rows(queryset, fields, chunk_size=EXPORT_CHUNK_SIZE):
+    return queryset.order_by('pk').values_list(*fields).iterator(
+        chunk_size=chunk_size
+    )
+
+
+def iter_jsonl(rows, fields):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(fields, row))) + '\n'
+
+
+def iter_csv(rows, fields):
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+EXPORT_FORMATS = {
+    'jsonl': iter_jsonl,
+    'csv': iter_csv,
+}
+
+
+def iter_export(queryset, kind, export_format, chunk_size=EXPORT_CHUNK_SIZE):
+    fields = EXPORT_FIELDS[kind]
+    return EXPORT_FORMATS[export_format](
+        iter_rows(queryset, fields, chunk_size), fields
+    )
+
+
+def iter_gzip(lines):
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for line in lines:
+        chunk = compressor.compress(line.encode())
+        if chunk:
+            yield chunk
+    yield compressor.flush()
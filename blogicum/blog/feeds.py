@@ -0,0 +1,143 @@
+from django.contrib.syndication.views import Feed
+from django.core.cache import cache
+from django.db.models.functions import Substr
+from django.http import Http404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.text import Truncator
+
+from .cache import (
+    POSTS_TAG, SITE_TAG, cache_response, category_tag, get_page_cache_key,
+    get_page_etag, profile_tag, set_page_etag
+)
+from .catalog import catalog
+from .constants import FEED_EXCERPT_LENGTH, FEED_ITEMS
+from .models import Post
+from .profiles import get_profile
+
+
+class PostFeed(Feed):
+    use_read_replica = True
+    description = 'Новые публикации Блогикума.'
+
+    def get_cache_tags(self, **kwargs):
+        return [POSTS_TAG]
+
+    def __call__(self, request, *args, **kwargs):
+        tags = [SITE_TAG, *self.get_cache_tags(**kwargs)]
+        etag = get_page_etag(request, tags)
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            return response
+        key = get_page_cache_key(
+            request, request.resolver_match.view_name, tags
+        )
+        response = cache.get(key)
+        if response is None:
+            response = super().__call__(request, *args, **kwargs)
+            cache_response(key, response)
+        return set_page_etag(response, etag)
+
+    def get_posts(self, obj):
+        return Post.objects.filter_posts()
+
+    def items(self, obj):
+        return self.get_posts(obj).values(
+            'id', 'title', 'pub_date', 'updated_at', 'category_id',
+            'author__username',
+            excerpt=Substr('text', 1, FEED_EXCERPT_LENGTH + 1)
+        )[:FEED_ITEMS]
+
+    def title(self, obj):
+        return 'Блогикум'
+
+    def link(self, obj):
+        return reverse('blog:index')
+
+    def item_title(self, item):
+        return item['title']
+
+    def item_description(self, item):
+        return Truncator(item['excerpt']).chars(FEED_EXCERPT_LENGTH)
+
+    def item_link(self, item):
+        return reverse('blog:post_detail', args=[item['id']])
+
+    def item_pubdate(self, item):
+        return item['pub_date']
+
+    def item_updateddate(self, item):
+        return item['updated_at']
+
+    def item_author_name(self, item):
+        return item['author__username']
+
+    def item_categories(self, item):
+        category = catalog.get_category(item['category_id'])
+        return [category.title] if category is not None else []
+
+
+class CategoryPostFeed(PostFeed):
+    def get_cache_tags(self, category_slug):
+        return [category_tag(category_slug)]
+
+    def get_object(self, request, category_slug):
+        category = catalog.get_published_category(category_slug)
+        if category is None:
+            raise Http404('Категория не найдена.')
+        return category
+
+    def get_posts(self, obj):
+        return super().get_posts(obj).filter(category=obj)
+
+    def title(self, obj):
+        return f'Блогикум: {obj.title}'
+
+    def link(self, obj):
+        return reverse('blog:category_posts', args=[obj.slug])
+
+    def description(self, obj):
+        return obj.description
+
+
+class ProfilePostFeed(PostFeed):
+    def get_cache_tags(self, username):
+        return [profile_tag(username)]
+
+    def get_object(self, request, username):
+        profile = get_profile(username)
+        if profile is None:
+            raise Http404('Пользователь не найден.')
+        return profile
+
+    def get_posts(self, obj):
+        return super().get_posts(obj).filter(author_id=obj.pk)
+
+    def title(self, obj):
+        return f'Блогикум: публикации {obj.username}'
+
+    def link(self, obj):
+        return reverse('blog:profile', args=[obj.username])
+
+    def description(self, obj):
+        return f'Новые публикации пользователя {obj.username}.'
+
+
+class PostAtomFeed(PostFeed):
+    feed_type = Atom1Feed
+    subtitle = PostFeed.description
+
+
+class CategoryPostAtomFeed(CategoryPostFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
+
+
+class ProfilePostAtomFeed(ProfilePostFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
@@ -0,0 +1,86 @@
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, features
+
+from .constants import (
+    IMAGE_SRCSET_WIDTHS, IMAGE_VARIANT_WIDTHS, IMAGE_VARIANTS_DIR
+)
+
+VARIANT_FORMAT = 'webp' if features.check('webp') else 'jpeg'
+EXIF_ORIENTATION = 0x0112
+
+
+def get_variant_name(name, width, image_format=VARIANT_FORMAT):
+    stem = os.path.splitext(name)[0]
+    return f'{IMAGE_VARIANTS_DIR}/{stem}_{width}w.{image_format}'
+
+
+def make_variant(image, width, image_format=VARIANT_FORMAT):
+    name = get_variant_name(image.name, width, image_format)
+    if image.storage.exists(name):
+        return name
+    with image.storage.open(image.name, 'rb') as source:
+        picture = ImageOps.exif_transpose(Image.open(source))
+        if picture.width <= width:
+            return None
+        picture.thumbnail((width, width * 4))
+        if picture.mode not in ('RGB', 'RGBA'):
+            picture = picture.convert('RGB')
+        if image_format == 'jpeg':
+            picture = picture.convert('RGB')
+        buffer = BytesIO()
+        picture.save(buffer, format=image_format, quality=80)
+    return image.storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def get_variant_url(image, width):
+    name = get_variant_name(image.name, width)
+    if image.storage.exists(name):
+        return image.storage.url(name)
+    return image.url
+
+
+def get_width(image):
+    """Ширина оригинала с учётом поворота из EXIF."""
+    with image.storage.open(image.name, 'rb') as source:
+        picture = Image.open(source)
+        if picture.getexif().get(EXIF_ORIENTATION) in (5, 6, 7, 8):
+            return picture.height
+        return picture.width
+
+
+def get_srcset(image, widths=IMAGE_SRCSET_WIDTHS):
+    variants = [
+        (get_variant_name(image.name, width), width) for width in widths
+    ]
+    variants = [
+        (name, width) for name, width in variants
+        if image.storage.exists(name)
+    ]
+    if not variants:
+        return ''
+    srcset = [
+        f'{image.storage.url(name)} {width}w' for name, width in variants
+    ]
+    if len(variants) < len(widths):
+        srcset.append(f'{image.url} {get_width(image)}w')
+    return ', '.join(srcset)
+
+
+def make_all_variants(image):
+    """Уменьшенные копии изображения; шире оригинала копии не делаются.
+
+    Без копии нужной ширины в карточке остаётся оригинал, а в srcset
+    недостающие копии заменяет оригинал с его настоящей шириной.
+    """
+    widths = {*IMAGE_VARIANT_WIDTHS.values(), *IMAGE_SRCSET_WIDTHS}
+    names = [make_variant(image, width) for width in sorted(widths)]
+    return [name for name in names if name is not None]
+
+
+def delete_variants(storage, name):
+    widths = {*IMAGE_VARIANT_WIDTHS.values(), *IMAGE_SRCSET_WIDTHS}
+    for width in widths:
+        storage.delete(get_variant_name(name, width))
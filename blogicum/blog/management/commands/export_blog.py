@@ -0,0 +1,61 @@
+import gzip
+import sys
+
+from django.core.management.base import BaseCommand
+
+from blog.exports import (
+    EXPORT_CHUNK_SIZE, EXPORT_FORMATS, EXPORT_MODELS, iter_export
+)
+
+
+class Command(BaseCommand):
+    help = 'Потоково выгружает публикации или комментарии в JSONL или CSV.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=tuple(EXPORT_MODELS))
+        parser.add_argument(
+            '--format',
+            choices=tuple(EXPORT_FORMATS),
+            default='jsonl'
+        )
+        parser.add_argument(
+            '--output',
+            help='Файл для выгрузки; по умолчанию — стандартный вывод.'
+        )
+        parser.add_argument(
+            '--gzip',
+            action='store_true',
+            help='Сжимать выгрузку gzip.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXPORT_CHUNK_SIZE
+        )
+
+    def handle(self, *args, **options):
+        lines = iter_export(
+            EXPORT_MODELS[options['kind']].objects.all(),
+            options['kind'],
+            options['format'],
+            options['chunk_size']
+        )
+        if options['output'] is None and not options['gzip']:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+        if options['gzip']:
+            output = gzip.open(
+                options['output'] or sys.stdout.buffer, 'wt',
+                encoding='utf-8', newline=''
+            )
+        else:
+            output = open(
+                options['output'], 'w', encoding='utf-8', newline=''
+            )
+        with output:
+            output.writelines(lines)
+        if options['output']:
+            self.stdout.write(self.style.SUCCESS(
+                f'Выгрузка сохранена в {options["output"]}.'
+            ))
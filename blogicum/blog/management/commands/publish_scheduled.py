@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog.cache import invalidate_posts
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = (
+        'Открывает отложенные публикации, дата которых наступила, '
+        'и сбрасывает кэш затронутых страниц.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Повторять проверку каждые N секунд (0 — один запуск).'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            changed = Post.objects.refresh_visibility()
+            if changed:
+                invalidate_posts(Post.objects.select_related(
+                    'author', 'category'
+                ).filter(pk__in=changed))
+            self.stdout.write(f'Обновлено публикаций: {len(changed)}')
+            if not options['interval']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blog.constants import SEARCH_INDEX_BATCH_SIZE
+from blog.models import Post
+from blog.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Перестраивает поисковый индекс публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=SEARCH_INDEX_BATCH_SIZE,
+            help='Сколько публикаций индексировать за одну транзакцию.'
+        )
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        batch_size = options['batch_size']
+        backend.clear()
+        posts = Post.objects.order_by().only('id', 'title', 'text').iterator(
+            chunk_size=batch_size
+        )
+        batch, indexed = [], 0
+        for post in posts:
+            batch.append(post)
+            if len(batch) == batch_size:
+                indexed += self.index(backend, batch)
+                batch = []
+        indexed += self.index(backend, batch)
+        self.stdout.write(
+            self.style.SUCCESS(f'Проиндексировано публикаций: {indexed}')
+        )
+
+    def index(self, backend, posts):
+        with transaction.atomic():
+            backend.index_posts(posts)
+        return len(posts)
@@ -0,0 +1,159 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from blog.cache import CATALOG_TAG, SITE_TAG, invalidate
+from blog.catalog import catalog
+from blog.models import (
+    Category, Comment, Location, Post, published_posts
+)
+from blog.profiles import invalidate_profiles
+from blog.search import get_search_backend
+
+User = get_user_model()
+
+WORDS = (
+    'блог', 'путешествие', 'город', 'море', 'горы', 'книга', 'фильм',
+    'рецепт', 'утро', 'вечер', 'друзья', 'музыка', 'история', 'лето',
+    'зима', 'дорога', 'парк', 'кофе', 'работа', 'проект', 'код', 'python',
+)
+
+
+class Command(BaseCommand):
+    help = 'Заполняет базу синтетическими данными для нагрузочных тестов.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10)
+        parser.add_argument('--categories', type=int, default=5)
+        parser.add_argument('--locations', type=int, default=5)
+        parser.add_argument('--posts', type=int, default=100)
+        parser.add_argument('--comments', type=int, default=500)
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Зерно генератора случайных чисел.'
+        )
+
+    def words(self, count):
+        return ' '.join(self.random.choice(WORDS) for _ in range(count))
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        if options['posts'] and not (
+            options['users'] and options['categories']
+            and options['locations']
+        ):
+            raise CommandError(
+                'Для публикаций нужны пользователи, категории '
+                'и местоположения.'
+            )
+        self.random = random.Random(options['seed'])
+        batch_size = options['batch_size']
+        prefix = f'seed{options["seed"]}'
+        now = timezone.now()
+
+        password = make_password(None)
+        User.objects.bulk_create(
+            (
+                User(username=f'{prefix}_user_{i}', password=password)
+                for i in range(options['users'])
+            ),
+            batch_size=batch_size,
+            ignore_conflicts=True
+        )
+        users = User.objects.filter(username__startswith=f'{prefix}_user_')
+        user_ids = list(users.values_list('pk', flat=True))
+        Category.objects.bulk_create(
+            (
+                Category(
+                    title=self.words(2),
+                    description=self.words(10),
+                    slug=f'{prefix}-category-{i}'
+                )
+                for i in range(options['categories'])
+            ),
+            batch_size=batch_size,
+            ignore_conflicts=True
+        )
+        category_ids = list(Category.objects.filter(
+            slug__startswith=f'{prefix}-category-'
+        ).values_list('pk', flat=True))
+        last_location = Location.objects.order_by('-pk').values_list(
+            'pk', flat=True
+        ).first() or 0
+        Location.objects.bulk_create(
+            (
+                Location(name=self.words(1))
+                for _ in range(options['locations'])
+            ),
+            batch_size=batch_size
+        )
+        location_ids = list(Location.objects.filter(
+            pk__gt=last_location
+        ).values_list('pk', flat=True))
+        last_post = Post.objects.order_by('-pk').values_list(
+            'pk', flat=True
+        ).first() or 0
+        Post.objects.bulk_create(
+            (
+                Post(
+                    title=self.words(3),
+                    text=self.words(60),
+                    pub_date=now - timedelta(
+                        minutes=self.random.randint(1, 60 * 24 * 365)
+                    ),
+                    author_id=self.random.choice(user_ids),
+                    category_id=self.random.choice(category_ids),
+                    location_id=self.random.choice(location_ids)
+                )
+                for _ in range(options['posts'] if user_ids else 0)
+            ),
+            batch_size=batch_size
+        )
+        posts = Post.objects.filter(pk__gt=last_post)
+        post_ids = list(posts.values_list('pk', flat=True))
+        Comment.objects.bulk_create(
+            (
+                Comment(
+                    text=self.words(15),
+                    post_id=self.random.choice(post_ids),
+                    author_id=self.random.choice(user_ids)
+                )
+                for _ in range(options['comments'] if post_ids else 0)
+            ),
+            batch_size=batch_size
+        )
+        posts.recount_comments()
+        posts.filter(published_posts()).update(is_visible=True)
+        self.index_posts(posts, batch_size)
+        usernames = list(users.values_list('username', flat=True))
+        transaction.on_commit(lambda: self.invalidate_caches(usernames))
+        self.stdout.write(self.style.SUCCESS(
+            'Создано: пользователей {users}, категорий {categories}, '
+            'местоположений {locations}, публикаций {posts}, '
+            'комментариев {comments}.'.format(**options)
+        ))
+
+    def invalidate_caches(self, usernames):
+        catalog.invalidate()
+        invalidate(SITE_TAG, CATALOG_TAG)
+        invalidate_profiles(*usernames)
+
+    def index_posts(self, posts, batch_size):
+        backend = get_search_backend()
+        batch = []
+        for post in posts.only('id', 'title', 'text').iterator(
+            chunk_size=batch_size
+        ):
+            batch.append(post)
+            if len(batch) == batch_size:
+                backend.index_posts(batch)
+                batch = []
+        backend.index_posts(batch)
@@ -0,0 +1,201 @@
+import time
+
+from django.apps import apps
+from django.core import serializers
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from blog.cache import SITE_TAG, invalidate
+from blog.models import Post, published_posts
+from blog.streaming import iter_json_array
+
+
+class Command(BaseCommand):
+    help = (
+        'Потоково загружает фикстуру в формате dumpdata: модели '
+        'загружаются в порядке зависимостей пачками через bulk insert.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('fixture', help='Путь к JSON-фикстуре.')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Сколько объектов вставлять за одну транзакцию.'
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='Псевдоним базы данных для загрузки.'
+        )
+        parser.add_argument(
+            '-e', '--exclude',
+            action='append',
+            default=[],
+            help='Не загружать указанное приложение или модель '
+            '(app_label или app_label.ModelName).'
+        )
+        parser.add_argument(
+            '--skip-search-index',
+            action='store_true',
+            help='Не перестраивать поисковый индекс после загрузки.'
+        )
+
+    def handle(self, *args, **options):
+        self.using = options['database']
+        self.batch_size = options['batch_size']
+        models = [
+            model for model in self.get_models(options['fixture'])
+            if not {
+                model._meta.app_label, model._meta.label_lower
+            } & {label.lower() for label in options['exclude']}
+        ]
+        started = time.perf_counter()
+        total = 0
+        for model in models:
+            total += self.load_model(options['fixture'], model)
+        self.reset_sequences(models)
+        if Post in models:
+            self.refresh_posts(options['skip_search_index'])
+        invalidate(SITE_TAG)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Загружено объектов: {total} за {elapsed:.1f} с '
+            f'({total / max(elapsed, 1e-6):.0f} строк/с).'
+        ))
+
+    def get_models(self, fixture):
+        labels = {item['model'] for item in iter_json_array(fixture)}
+        try:
+            models = [apps.get_model(label) for label in labels]
+        except LookupError as error:
+            raise CommandError(str(error))
+        return self.sort_models(models)
+
+    def sort_models(self, models):
+        pending = sorted(models, key=lambda model: model._meta.label)
+        ordered = []
+        while pending:
+            for model in pending:
+                dependencies = {
+                    field.related_model
+                    for field in model._meta.get_fields()
+                    if field.concrete and field.is_relation
+                    and field.related_model in pending
+                    and field.related_model is not model
+                }
+                if not dependencies:
+                    ordered.append(model)
+                    pending.remove(model)
+                    break
+            else:
+                ordered.extend(pending)
+                break
+        return ordered
+
+    def load_model(self, fixture, model):
+        label = model._meta.label_lower
+        manager = model._base_manager.using(self.using)
+        rows_before = manager.count()
+        started = time.perf_counter()
+        batch, read = [], 0
+        for item in iter_json_array(fixture):
+            if item['model'] != label:
+                continue
+            batch.append(item)
+            if len(batch) == self.batch_size:
+                read += self.insert(model, batch)
+                batch = []
+        read += self.insert(model, batch)
+        elapsed = time.perf_counter() - started
+        loaded = manager.count() - rows_before
+        self.stdout.write(
+            f'{label}: {loaded} из {read} строк '
+            f'(пропущено уже существующих: {read - loaded}), '
+            f'{read / max(elapsed, 1e-6):.0f} строк/с'
+        )
+        return loaded
+
+    def insert(self, model, items):
+        if not items:
+            return 0
+        deserialized = list(serializers.deserialize(
+            'python', items, using=self.using, ignorenonexistent=True
+        ))
+        objects = [item.object for item in deserialized]
+        manager = model._base_manager.using(self.using)
+        opts = model._meta
+        auto_fields = [
+            field for field in opts.local_concrete_fields
+            if getattr(field, 'auto_now', False)
+            or getattr(field, 'auto_now_add', False)
+        ]
+        for obj in objects:
+            for field in auto_fields:
+                if getattr(obj, field.attname) is None:
+                    field.pre_save(obj, add=True)
+        with transaction.atomic(using=self.using):
+            for has_pk in (True, False):
+                group = [
+                    obj for obj in objects if (obj.pk is not None) == has_pk
+                ]
+                fields = [
+                    field for field in opts.local_concrete_fields
+                    if has_pk or field is not opts.pk
+                ]
+                self.insert_rows(manager, group, fields)
+            self.insert_m2m(opts, deserialized)
+        return len(objects)
+
+    def insert_rows(self, manager, objects, fields):
+        if not objects:
+            return
+        ops = connections[self.using].ops
+        size = min(
+            self.batch_size, max(ops.bulk_batch_size(fields, objects), 1)
+        )
+        for start in range(0, len(objects), size):
+            manager._insert(
+                objects[start:start + size],
+                fields=fields,
+                raw=True,
+                using=self.using,
+                ignore_conflicts=True
+            )
+
+    def insert_m2m(self, opts, deserialized):
+        for field in opts.many_to_many:
+            through = field.remote_field.through
+            rows = [
+                through(**{
+                    f'{field.m2m_field_name()}_id': item.object.pk,
+                    f'{field.m2m_reverse_field_name()}_id': related_pk,
+                })
+                for item in deserialized
+                for related_pk in (item.m2m_data or {}).get(field.name, ())
+            ]
+            through._base_manager.using(self.using).bulk_create(
+                rows, batch_size=self.batch_size, ignore_conflicts=True
+            )
+
+    def reset_sequences(self, models):
+        connection = connections[self.using]
+        sql = connection.ops.sequence_reset_sql(no_style(), models)
+        if sql:
+            with connection.cursor() as cursor:
+                for line in sql:
+                    cursor.execute(line)
+
+    def refresh_posts(self, skip_search_index):
+        posts = Post.objects.using(self.using)
+        posts.recount_comments()
+        posts.filter(published_posts()).update(is_visible=True)
+        if not skip_search_index:
+            call_command(
+                'rebuild_search_index',
+                batch_size=self.batch_size,
+                stdout=self.stdout
+            )
@@ -1,14 +1,32 @@
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.http import HttpResponseRedirect
+from django.core.cache import cache
+from django.core.paginator import InvalidPage
+from django.http import Http404, HttpResponseRedirect
 from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response, patch_cache_control
 
 from .models import Post, Comment
 from .forms import PostForm, CommentForm
+from .cache import (
+    SITE_TAG, cache_response, get_page_cache_key, get_page_etag,
+    set_page_etag
+)
+from .paginators import CursorPaginator
 
 
-class AuthorMixin(UserPassesTestMixin):
+class CachedObjectMixin:
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)
+        if not hasattr(self, '_cached_object'):
+            self._cached_object = super().get_object()
+        return self._cached_object
+
+
+class AuthorMixin(CachedObjectMixin, UserPassesTestMixin):
     def test_func(self):
-        return self.request.user == self.get_object().author
+        return self.request.user.pk == self.get_object().author_id
 
 
 class PostMixin(LoginRequiredMixin, AuthorMixin):
@@ -17,6 +35,9 @@ class PostMixin(LoginRequiredMixin, AuthorMixin):
     pk_url_kwarg = 'post_id'
     form_class = PostForm
 
+    def get_queryset(self):
+        return Post.objects.select_related('location')
+
     def handle_no_permission(self):
         return HttpResponseRedirect(
             reverse_lazy(
@@ -35,7 +56,7 @@ class PostMixin(LoginRequiredMixin, AuthorMixin):
         return context
 
 
-class CommentMixin(LoginRequiredMixin):
+class CommentMixin(CachedObjectMixin, LoginRequiredMixin):
     model = Comment
     form_class = CommentForm
     template_name = 'blog/comment.html'
@@ -45,3 +66,57 @@ class CommentMixin(LoginRequiredMixin):
         return reverse_lazy(
             'blog:post_detail', kwargs={'post_id': self.kwargs['post_id']}
         )
+
+
+class CursorPaginationMixin:
+    cursor_kwarg = 'cursor'
+
+    def paginate_queryset(self, queryset, page_size):
+        if not settings.BLOG_CURSOR_PAGINATION:
+            return super().paginate_queryset(queryset, page_size)
+        paginator = CursorPaginator(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidPage as e:
+            raise Http404(str(e))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class AnonymousCacheMixin:
+    def get_cache_tags(self):
+        return []
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method != 'GET' or request.user.is_authenticated:
+            return super().dispatch(request, *args, **kwargs)
+        key = get_page_cache_key(
+            request,
+            request.resolver_match.view_name,
+            [SITE_TAG, *self.get_cache_tags()]
+        )
+        response = cache.get(key)
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code == 200 and not response.cookies:
+                cache_response(key, response)
+        return response
+
+
+class ConditionalGetMixin:
+    def get_cache_tags(self):
+        return []
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return super().dispatch(request, *args, **kwargs)
+        if request.user.is_authenticated:
+            response = super().dispatch(request, *args, **kwargs)
+            patch_cache_control(response, private=True)
+            return response
+        etag = get_page_etag(request, self.get_cache_tags())
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            return response
+        return set_page_etag(
+            super().dispatch(request, *args, **kwargs), etag
+        )
@@ -2,30 +2,75 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.urls import reverse
-from django.db.models import Count
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
-from core.models import PublishedModel, CreatedModel
-from .constants import STR_LENGHT, FILDS_MAX_LENGHT
+from core.models import PublishedModel, CreatedModel, UpdatedModel
+from .constants import (
+    STR_LENGHT, FILDS_MAX_LENGHT, SEARCH_TERM_MAX_LENGTH
+)
 
 User = get_user_model()
 
 
+def published_posts():
+    return models.Q(
+        is_published=True,
+        pub_date__lte=timezone.now(),
+        category__is_published=True
+    )
+
+
+class CatalogModelIterable(models.query.ModelIterable):
+    """Подставляет категории и местоположения из каталога в памяти."""
+
+    def __iter__(self):
+        from .catalog import catalog
+        for post in super().__iter__():
+            catalog.attach([post])
+            yield post
+
+
 class PostQuerySet(models.QuerySet):
+    def with_catalog(self):
+        clone = self._chain()
+        if clone._iterable_class is models.query.ModelIterable:
+            clone._iterable_class = CatalogModelIterable
+        return clone
+
     def filter_posts(self):
-        return self.filter(
-            is_published=True,
-            pub_date__lte=timezone.now(),
-            category__is_published=True
-        ).order_by('-pub_date')
+        return self.filter(is_visible=True).order_by('-pub_date')
+
+    def visible_to(self, user):
+        if user.is_authenticated:
+            return self.filter(
+                models.Q(is_visible=True) | models.Q(author=user)
+            )
+        return self.filter(is_visible=True)
+
+    def refresh_visibility(self):
+        shown = list(self.filter(published_posts()).filter(
+            is_visible=False
+        ).values_list('pk', flat=True))
+        hidden = list(self.filter(is_visible=True).exclude(
+            published_posts()
+        ).values_list('pk', flat=True))
+        Post.objects.filter(pk__in=shown).update(is_visible=True)
+        Post.objects.filter(pk__in=hidden).update(is_visible=False)
+        return shown + hidden
 
     def get_comments_count(self):
-        return self.select_related(
-            'location',
-            'author',
-            'category'
-        ).annotate(
-            comment_count=Count('comments')
-        ).order_by('-pub_date')
+        return self.select_related('author').with_catalog().order_by(
+            '-pub_date'
+        )
+
+    def recount_comments(self):
+        comments = Comment.objects.filter(
+            post=OuterRef('pk')
+        ).order_by().values('post').annotate(
+            total=Count('pk')
+        ).values('total')
+        return self.update(comment_count=Coalesce(Subquery(comments), 0))
 
 
 class PostManager(models.Manager):
@@ -38,6 +83,12 @@ class PostManager(models.Manager):
     def get_comments_count(self):
         return self.get_queryset().get_comments_count()
 
+    def recount_comments(self):
+        return self.get_queryset().recount_comments()
+
+    def refresh_visibility(self):
+        return self.get_queryset().refresh_visibility()
+
 
 class Location(PublishedModel, CreatedModel):
     name = models.CharField(
@@ -71,7 +122,7 @@ class Category(PublishedModel, CreatedModel):
         return self.title[:STR_LENGHT]
 
 
-class Post(PublishedModel, CreatedModel):
+class Post(PublishedModel, CreatedModel, UpdatedModel):
     title = models.CharField('Заголовок', max_length=FILDS_MAX_LENGHT)
     text = models.TextField('Текст')
     pub_date = models.DateTimeField(
@@ -101,16 +152,51 @@ class Post(PublishedModel, CreatedModel):
         related_name='posts'
     )
     image = models.ImageField('Фото', upload_to='birthdays_images', blank=True)
+    is_visible = models.BooleanField(
+        'Показывается в ленте',
+        default=False,
+        editable=False
+    )
+    comment_count = models.PositiveIntegerField(
+        'Количество комментариев',
+        default=0,
+        editable=False
+    )
     objects = PostManager()
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date',)
+        indexes = (
+            models.Index(
+                fields=('-pub_date',),
+                condition=models.Q(is_visible=True),
+                name='post_visible_feed_idx'
+            ),
+            models.Index(
+                fields=('category', '-pub_date'),
+                condition=models.Q(is_visible=True),
+                name='post_visible_category_idx'
+            ),
+            models.Index(
+                fields=('author', '-pub_date'),
+                name='post_author_pub_date_idx'
+            ),
+        )
 
     def __str__(self):
         return self.title[:STR_LENGHT]
 
+    def save(self, *args, **kwargs):
+        self.is_visible = (
+            self.is_published
+            and self.pub_date <= timezone.now()
+            and self.category is not None
+            and self.category.is_published
+        )
+        super().save(*args, **kwargs)
+
     def get_absolute_url(self):
         return reverse('blog:post_detail', kwargs={'pk': self.pk})
 
@@ -132,6 +218,36 @@ class Comment(CreatedModel):
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
         default_related_name = 'comments'
+        indexes = (
+            models.Index(
+                fields=('post', 'created_at'),
+                name='comment_post_created_at_idx'
+            ),
+        )
 
     def __str__(self):
         return self.text[:STR_LENGHT]
+
+
+class SearchIndexEntry(models.Model):
+    term = models.CharField('Термин', max_length=SEARCH_TERM_MAX_LENGTH)
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        verbose_name='Публикация',
+        related_name='search_entries'
+    )
+    weight = models.FloatField('Вес')
+
+    class Meta:
+        verbose_name = 'запись поискового индекса'
+        verbose_name_plural = 'Поисковый индекс'
+        indexes = (
+            models.Index(
+                fields=('term', 'post'),
+                name='search_term_post_idx'
+            ),
+        )
+
+    def __str__(self):
+        return self.term
@@ -0,0 +1,214 @@
+import base64
+import binascii
+import hashlib
+from collections.abc import Sequence
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import (
+    EmptyPage, InvalidPage, Page, PageNotAnInteger, Paginator
+)
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from .cache import POSTS_TAG, SITE_TAG, get_tag_versions
+
+COUNT_KEY = 'blog:count:{}:{}'
+APPROXIMATE_COUNT_KEY = 'blog:count:{}'
+
+NEXT = 'n'
+PREVIOUS = 'p'
+
+
+class KnownCountPaginator(Paginator):
+    """Пагинатор, которому число объектов известно заранее."""
+
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count = count
+
+    def page_with(self, number, object_list):
+        """Страница из уже выбранных объектов."""
+        return Page(object_list, self.validate_number(number), self)
+
+
+class CachedCountPaginator(Paginator):
+    """Пагинатор, который кеширует число объектов по тексту запроса.
+
+    Точное число сбрасывается вместе с версиями тегов публикаций.
+    Выборки больше BLOG_PAGINATOR_APPROXIMATE_THRESHOLD считаются
+    приблизительно: их число живёт в кеше дольше и не пересчитывается
+    при каждом изменении.
+    """
+
+    approximate = False
+
+    def get_query_digest(self):
+        return hashlib.md5(
+            f'{self.object_list.db}|{self.object_list.query}'.encode()
+        ).hexdigest()
+
+    @cached_property
+    def count(self):
+        digest = self.get_query_digest()
+        approximate_key = APPROXIMATE_COUNT_KEY.format(digest)
+        key = COUNT_KEY.format(
+            digest, '|'.join(get_tag_versions([SITE_TAG, POSTS_TAG]))
+        )
+        cached = cache.get_many([approximate_key, key])
+        if approximate_key in cached:
+            self.approximate = True
+            return cached[approximate_key]
+        if key in cached:
+            return cached[key]
+        count = super().count
+        if count > settings.BLOG_PAGINATOR_APPROXIMATE_THRESHOLD:
+            self.approximate = True
+            cache.set(
+                approximate_key,
+                count,
+                settings.BLOG_PAGINATOR_APPROXIMATE_TIMEOUT
+            )
+        else:
+            cache.set(key, count, settings.BLOG_PAGINATOR_COUNT_TIMEOUT)
+        return count
+
+    def validate_number(self, number):
+        self.count
+        if not self.approximate:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('Номер страницы должен быть целым числом.')
+        if number < 1:
+            raise EmptyPage('Номер страницы меньше 1.')
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.approximate:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        return self.page_with(
+            number, self.object_list[bottom:bottom + self.per_page + 1]
+        )
+
+    def page_with(self, number, object_list):
+        """Страница из уже выбранных объектов.
+
+        Объект сверх per_page означает, что следующая страница есть: по нему
+        уточняется приблизительное число, а пустая выборка — конец ленты.
+        """
+        number = self.validate_number(number)
+        object_list = list(object_list)
+        has_next = len(object_list) > self.per_page
+        object_list = object_list[:self.per_page]
+        if self.approximate:
+            if not object_list and number > 1:
+                raise EmptyPage('На этой странице нет публикаций.')
+            seen = (number - 1) * self.per_page + len(object_list)
+            self.count = max(self.count, seen + 1) if has_next else seen
+            self.__dict__.pop('num_pages', None)
+        return Page(object_list, number, self)
+
+
+class CursorPage(Sequence):
+    is_cursor = True
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return '<Cursor page of %s items>' % len(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        if not self.has_next() or not self.object_list:
+            return None
+        return self.paginator.encode_cursor(NEXT, self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        if not self.has_previous() or not self.object_list:
+            return None
+        return self.paginator.encode_cursor(PREVIOUS, self.object_list[0])
+
+
+class CursorPaginator:
+    """Keyset-пагинатор по паре (pub_date, id) без COUNT и OFFSET."""
+
+    def __init__(self, object_list, per_page):
+        self.object_list = object_list.order_by('-pub_date', '-id')
+        self.per_page = int(per_page)
+
+    def encode_cursor(self, direction, post):
+        if isinstance(post, dict):
+            pub_date, pk = post['pub_date'], post['id']
+        else:
+            pub_date, pk = post.pub_date, post.pk
+        raw = f'{direction}|{pub_date.isoformat()}|{pk}'
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            direction, pub_date, pk = raw.split('|')
+            pub_date = datetime.fromisoformat(pub_date)
+            pk = int(pk)
+        except (binascii.Error, UnicodeError, ValueError):
+            raise InvalidPage('Некорректный курсор страницы.')
+        if direction not in (NEXT, PREVIOUS):
+            raise InvalidPage('Некорректный курсор страницы.')
+        return direction, pub_date, pk
+
+    def page(self, cursor=None):
+        if not cursor:
+            posts = list(self.object_list[:self.per_page + 1])
+            return CursorPage(
+                posts[:self.per_page], self,
+                has_next=len(posts) > self.per_page,
+                has_previous=False
+            )
+        direction, pub_date, pk = self.decode_cursor(cursor)
+        if direction == NEXT:
+            posts = list(self.object_list.filter(
+                Q(pub_date__lt=pub_date) | Q(pub_date=pub_date, pk__lt=pk)
+            )[:self.per_page + 1])
+            if not posts:
+                raise EmptyPage('На этой странице нет публикаций.')
+            return CursorPage(
+                posts[:self.per_page], self,
+                has_next=len(posts) > self.per_page,
+                has_previous=True
+            )
+        posts = list(self.object_list.filter(
+            Q(pub_date__gt=pub_date) | Q(pub_date=pub_date, pk__gt=pk)
+        ).order_by('pub_date', 'id')[:self.per_page + 1])
+        if not posts:
+            raise EmptyPage('На этой странице нет публикаций.')
+        return CursorPage(
+            posts[:self.per_page][::-1], self,
+            has_next=True,
+            has_previous=len(posts) > self.per_page
+        )
@@ -0,0 +1,44 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import User
+
+PROFILE_KEY = 'blog:profile:{}'
+PROFILE_FIELDS = (
+    'id', 'username', 'first_name', 'last_name', 'date_joined', 'is_staff'
+)
+
+
+def get_profile_key(username):
+    return PROFILE_KEY.format(hashlib.md5(username.encode()).hexdigest())
+
+
+def get_profile(username):
+    """Облегчённый пользователь по имени из кеша или None.
+
+    Неизвестные имена тоже кешируются, пустой записью.
+    """
+    key = get_profile_key(username)
+    record = cache.get(key)
+    if record is None:
+        record = User.objects.filter(username=username).values(
+            *PROFILE_FIELDS
+        ).first() or {}
+        cache.set(
+            key,
+            record,
+            settings.BLOG_PROFILE_CACHE_TIMEOUT
+            if record
+            else settings.BLOG_PROFILE_MISSING_TIMEOUT
+        )
+    if not record:
+        return None
+    profile = User(**record)
+    profile._state.adding = False
+    return profile
+
+
+def invalidate_profiles(*usernames):
+    cache.delete_many([get_profile_key(username) for username in usernames])
@@ -0,0 +1,248 @@
+import math
+import re
+from collections import Counter
+from collections.abc import Sequence
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Case, Count, F, FloatField, Sum, When
+from django.utils.module_loading import import_string
+
+from .constants import (
+    SEARCH_DOCUMENTS_TIMEOUT, SEARCH_RESULTS_LIMIT, SEARCH_TERM_MAX_LENGTH,
+    SEARCH_TITLE_WEIGHT
+)
+from .models import Post, SearchIndexEntry
+
+FTS_TABLE = 'blog_post_fts'
+DOCUMENTS_KEY = 'blog:search:documents'
+WORD = re.compile(r'[0-9a-zа-яё]+')
+CYRILLIC = re.compile(r'[а-я]')
+
+RV = re.compile(r'^(.*?[аеиоуыэюя])(.*)$')
+PERFECTIVE_GERUND = re.compile(
+    r'((ив|ивши|ившись|ыв|ывши|ывшись)|((?<=[ая])(в|вши|вшись)))$'
+)
+REFLEXIVE = re.compile(r'(с[яь])$')
+ADJECTIVE = re.compile(
+    r'(ее|ие|ые|ое|ими|ыми|ей|ий|ый|ой|ем|им|ым|ом|его|ого|ему|ому|их|ых|'
+    r'ую|юю|ая|яя|ою|ею)$'
+)
+PARTICIPLE = re.compile(r'((ивш|ывш|ующ)|((?<=[ая])(ем|нн|вш|ющ|щ)))$')
+VERB = re.compile(
+    r'((ила|ыла|ена|ейте|уйте|ите|или|ыли|ей|уй|ил|ыл|им|ым|ен|ило|ыло|'
+    r'ено|ят|ует|уют|ит|ыт|ены|ить|ыть|ишь|ую|ю)|((?<=[ая])(ла|на|ете|йте|'
+    r'ли|й|л|ем|н|ло|но|ет|ют|ны|ть|ешь|нно)))$'
+)
+NOUN = re.compile(
+    r'(а|ев|ов|ие|ье|е|иями|ями|ами|еи|ии|и|ией|ей|ой|ий|й|иям|ям|ием|ем|'
+    r'ам|ом|о|у|ах|иях|ях|ы|ь|ию|ью|ю|ия|ья|я)$'
+)
+DERIVATIONAL = re.compile(r'.*[^аеиоуыэюя]+[аеиоуыэюя].*ость?$')
+DERIVATIONAL_SUFFIX = re.compile(r'ость?$')
+SUPERLATIVE = re.compile(r'(ейше|ейш)$')
+ENDING_I = re.compile(r'и$')
+SOFT_SIGN = re.compile(r'ь$')
+DOUBLE_N = re.compile(r'нн$')
+
+
+def stem(word):
+    """Стеммер Портера для русского языка."""
+    match = RV.match(word)
+    if not match:
+        return word
+    start, rv = match.groups()
+    temp = PERFECTIVE_GERUND.sub('', rv, 1)
+    if temp == rv:
+        rv = REFLEXIVE.sub('', rv, 1)
+        temp = ADJECTIVE.sub('', rv, 1)
+        if temp != rv:
+            rv = PARTICIPLE.sub('', temp, 1)
+        else:
+            temp = VERB.sub('', rv, 1)
+            rv = NOUN.sub('', rv, 1) if temp == rv else temp
+    else:
+        rv = temp
+    rv = ENDING_I.sub('', rv, 1)
+    if DERIVATIONAL.match(rv):
+        rv = DERIVATIONAL_SUFFIX.sub('', rv, 1)
+    temp = SOFT_SIGN.sub('', rv, 1)
+    if temp == rv:
+        rv = DOUBLE_N.sub('н', SUPERLATIVE.sub('', rv, 1), 1)
+    else:
+        rv = temp
+    return start + rv
+
+
+def tokenize(text):
+    terms = []
+    for word in WORD.findall(text.lower().replace('ё', 'е')):
+        term = stem(word) if CYRILLIC.search(word) else word
+        if len(term) > 1:
+            terms.append(term[:SEARCH_TERM_MAX_LENGTH])
+    return terms
+
+
+class SearchResults(Sequence):
+    """Список найденных публикаций, загружаемых постранично."""
+
+    def __init__(self, ids):
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        ids = self.ids[index]
+        posts = Post.objects.get_comments_count().in_bulk(ids)
+        return [posts[pk] for pk in ids if pk in posts]
+
+
+class FTS5Backend:
+    def index_posts(self, posts):
+        posts = list(posts)
+        self.remove_posts([post.pk for post in posts])
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {FTS_TABLE} (rowid, title, text) '
+                'VALUES (%s, %s, %s)',
+                [
+                    (
+                        post.pk,
+                        ' '.join(tokenize(post.title)),
+                        ' '.join(tokenize(post.text))
+                    )
+                    for post in posts
+                ]
+            )
+
+    def remove_posts(self, ids):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'DELETE FROM {FTS_TABLE} WHERE rowid = %s',
+                [(pk,) for pk in ids]
+            )
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE}')
+
+    def search(self, query, limit=SEARCH_RESULTS_LIMIT):
+        terms = tokenize(query)
+        if not terms:
+            return []
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT {FTS_TABLE}.rowid FROM {FTS_TABLE} '
+                f'JOIN {Post._meta.db_table} post '
+                f'ON post.id = {FTS_TABLE}.rowid '
+                f'WHERE {FTS_TABLE} MATCH %s AND post.is_visible = %s '
+                f'ORDER BY bm25({FTS_TABLE}, %s, 1.0) LIMIT %s',
+                [
+                    ' '.join(f'"{term}"' for term in terms),
+                    True,
+                    SEARCH_TITLE_WEIGHT,
+                    limit
+                ]
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class InvertedIndexBackend:
+    def count_documents(self):
+        total = cache.get(DOCUMENTS_KEY)
+        if total is None:
+            total = SearchIndexEntry.objects.order_by().values(
+                'post'
+            ).distinct().count()
+            cache.set(DOCUMENTS_KEY, total, SEARCH_DOCUMENTS_TIMEOUT)
+        return total
+
+    def index_posts(self, posts):
+        posts = list(posts)
+        entries = []
+        for post in posts:
+            weights = Counter(tokenize(post.text))
+            for term in tokenize(post.title):
+                weights[term] += SEARCH_TITLE_WEIGHT
+            entries.extend(
+                SearchIndexEntry(term=term, post_id=post.pk, weight=weight)
+                for term, weight in weights.items()
+            )
+        with transaction.atomic():
+            self.remove_posts([post.pk for post in posts])
+            SearchIndexEntry.objects.bulk_create(entries)
+        cache.delete(DOCUMENTS_KEY)
+
+    def remove_posts(self, ids):
+        SearchIndexEntry.objects.filter(post_id__in=ids).delete()
+        cache.delete(DOCUMENTS_KEY)
+
+    def clear(self):
+        SearchIndexEntry.objects.all().delete()
+        cache.delete(DOCUMENTS_KEY)
+
+    def search(self, query, limit=SEARCH_RESULTS_LIMIT):
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        entries = SearchIndexEntry.objects.filter(term__in=terms)
+        frequencies = dict(
+            entries.order_by().values_list('term').annotate(Count('pk'))
+        )
+        if len(frequencies) < len(terms):
+            return []
+        total = max(self.count_documents(), 1)
+        idf = {
+            term: math.log(1 + total / frequency)
+            for term, frequency in frequencies.items()
+        }
+        return list(entries.filter(post__is_visible=True).order_by().values(
+            'post'
+        ).annotate(
+            matched=Count('term'),
+            score=Sum(
+                Case(
+                    *(
+                        When(term=term, then=F('weight') * weight)
+                        for term, weight in idf.items()
+                    ),
+                    output_field=FloatField()
+                )
+            )
+        ).filter(matched=len(terms)).order_by(
+            '-score', '-post'
+        ).values_list('post', flat=True)[:limit])
+
+
+fts5_tables = {}
+
+
+def fts5_available():
+    """Есть ли таблица FTS5 в текущей базе.
+
+    Ответ запоминается для каждой базы и сбрасывается после миграций.
+    """
+    if connection.vendor != 'sqlite':
+        return False
+    name = connection.settings_dict['NAME']
+    if name not in fts5_tables:
+        fts5_tables[name] = (
+            FTS_TABLE in connection.introspection.table_names()
+        )
+    return fts5_tables[name]
+
+
+def reset_fts5_available():
+    fts5_tables.clear()
+
+
+def get_search_backend():
+    if settings.BLOG_SEARCH_BACKEND:
+        return import_string(settings.BLOG_SEARCH_BACKEND)()
+    if fts5_available():
+        return FTS5Backend()
+    return InvertedIndexBackend()
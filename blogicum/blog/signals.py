@@ -0,0 +1,160 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.db.models.signals import (
+    post_delete, post_migrate, post_save, pre_delete, pre_save
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from tasks.backends import enqueue
+
+from .cache import (
+    CATALOG_TAG, POSTS_TAG, SITE_TAG, get_post_tags, invalidate, post_tag
+)
+from .catalog import catalog
+from .profiles import invalidate_profiles
+from .models import Category, Comment, Location, Post
+from .search import get_search_backend, reset_fts5_available
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Comment)
+def increase_comment_count(sender, instance, created, **kwargs):
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1,
+            updated_at=timezone.now()
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comment_count(sender, instance, **kwargs):
+    Post.objects.filter(
+        pk=instance.post_id,
+        comment_count__gt=0
+    ).update(
+        comment_count=F('comment_count') - 1,
+        updated_at=timezone.now()
+    )
+
+
+@receiver(pre_save, sender=Post)
+def remember_old_post(sender, instance, **kwargs):
+    if instance.pk is None:
+        return
+    old_post = Post.objects.select_related('author', 'category').filter(
+        pk=instance.pk
+    ).first()
+    if old_post is not None:
+        instance._old_cache_tags = get_post_tags(old_post)
+        instance._old_image = old_post.image.name
+        instance._old_search_text = (old_post.title, old_post.text)
+
+
+@receiver(post_save, sender=Post)
+def schedule_image_variants(sender, instance, **kwargs):
+    old_image = getattr(instance, '_old_image', None)
+    if instance.image.name == old_image:
+        return
+    if old_image:
+        enqueue('blog.tasks.delete_image_variants', old_image)
+    if instance.image:
+        enqueue('blog.tasks.make_image_variants', instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def schedule_image_cleanup(sender, instance, **kwargs):
+    if instance.image:
+        enqueue('blog.tasks.delete_image_variants', instance.image.name)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_pages(sender, instance, **kwargs):
+    invalidate(
+        *getattr(instance, '_old_cache_tags', []),
+        *get_post_tags(instance)
+    )
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment_pages(sender, instance, created=False, **kwargs):
+    if kwargs['signal'] is post_save and not created:
+        invalidate(post_tag(instance.post_id))
+        return
+    post = Post.objects.select_related('author', 'category').filter(
+        pk=instance.post_id
+    ).first()
+    if post is None:
+        invalidate(POSTS_TAG, post_tag(instance.post_id))
+    else:
+        invalidate(*get_post_tags(post))
+
+
+@receiver(post_save, sender=Category)
+def refresh_category_posts(sender, instance, created, **kwargs):
+    if not created:
+        Post.objects.filter(category=instance).refresh_visibility()
+
+
+@receiver(pre_delete, sender=Category)
+def hide_category_posts(sender, instance, **kwargs):
+    Post.objects.filter(category=instance).update(is_visible=False)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_catalog_pages(sender, **kwargs):
+    catalog.invalidate()
+    invalidate(SITE_TAG, CATALOG_TAG)
+
+
+@receiver(pre_save, sender=User)
+def remember_old_username(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None or (
+        update_fields is not None and 'username' not in update_fields
+    ):
+        return
+    instance._old_username = User.objects.filter(pk=instance.pk).values_list(
+        'username', flat=True
+    ).first()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_profile(sender, instance, **kwargs):
+    old_username = getattr(instance, '_old_username', None)
+    invalidate_profiles(
+        instance.username, *([old_username] if old_username else [])
+    )
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_pages(sender, created, update_fields=None, **kwargs):
+    if created or (
+        update_fields and set(update_fields) <= {'last_login', 'password'}
+    ):
+        return
+    invalidate(SITE_TAG)
+
+
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    if getattr(instance, '_old_search_text', None) != (
+        instance.title, instance.text
+    ):
+        enqueue('blog.tasks.index_post', instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def remove_post_from_index(sender, instance, **kwargs):
+    get_search_backend().remove_posts([instance.pk])
+
+
+@receiver(post_migrate)
+def forget_search_tables(sender, **kwargs):
+    reset_fts5_available()
@@ -0,0 +1,33 @@
+import json
+
+READ_CHUNK_SIZE = 64 * 1024
+SEPARATORS = ' \t\r\n,['
+
+
+def iter_json_array(path, chunk_size=READ_CHUNK_SIZE):
+    """Поочерёдно возвращает элементы JSON-массива, не читая файл целиком."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    with open(path, encoding='utf-8') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            buffer += chunk
+            position = 0
+            while True:
+                while (
+                    position < len(buffer)
+                    and buffer[position] in SEPARATORS
+                ):
+                    position += 1
+                if buffer[position:position + 1] == ']':
+                    return
+                try:
+                    item, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if not chunk:
+                        raise
+                    break
+                yield item
+            buffer = buffer[position:]
+            if not chunk:
+                return
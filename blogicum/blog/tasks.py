@@ -0,0 +1,27 @@
+from django.utils import timezone
+
+from .cache import invalidate_posts
+from .images import delete_variants, make_all_variants
+from .models import Post
+from .search import get_search_backend
+
+
+def make_image_variants(post_id):
+    post = Post.objects.select_related('author', 'category').filter(
+        pk=post_id
+    ).first()
+    if post is None or not post.image:
+        return
+    make_all_variants(post.image)
+    Post.objects.filter(pk=post_id).update(updated_at=timezone.now())
+    invalidate_posts([post])
+
+
+def delete_image_variants(name):
+    delete_variants(Post._meta.get_field('image').storage, name)
+
+
+def index_post(post_id):
+    post = Post.objects.only('id', 'title', 'text').filter(pk=post_id).first()
+    if post is not None:
+        get_search_backend().index_posts([post])
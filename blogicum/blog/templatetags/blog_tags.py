@@ -0,0 +1,33 @@
+from django import template
+
+from blog.cache import SITE_TAG, get_tag_versions
+from blog.constants import (
+    IMAGE_VARIANT_WIDTHS, PAGINATOR_ON_EACH_SIDE, PAGINATOR_ON_ENDS
+)
+from blog.images import get_srcset, get_variant_url
+
+register = template.Library()
+
+
+@register.simple_tag
+def site_cache_version():
+    return get_tag_versions([SITE_TAG])[0]
+
+
+@register.simple_tag
+def image_variant(image, variant):
+    return get_variant_url(image, IMAGE_VARIANT_WIDTHS[variant])
+
+
+@register.simple_tag
+def image_srcset(image):
+    return get_srcset(image)
+
+
+@register.filter
+def elided_page_range(page):
+    return page.paginator.get_elided_page_range(
+        page.number,
+        on_each_side=PAGINATOR_ON_EACH_SIDE,
+        on_ends=PAGINATOR_ON_ENDS
+    )
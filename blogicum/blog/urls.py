@@ -1,28 +1,45 @@
+from django.conf import settings
 from django.urls import path
 
-from . import views
+from . import async_views, feeds, views
 
 app_name = 'blog'
 
+if settings.BLOG_ASYNC_VIEWS:
+    post_list = async_views.post_list
+    post_detail = async_views.post_detail
+    category_posts = async_views.category_posts
+    profile = async_views.profile
+else:
+    post_list = views.PostListView.as_view()
+    post_detail = views.PostDetailView.as_view()
+    category_posts = views.CategoryPostsView.as_view()
+    profile = views.ProfileView.as_view()
+
 urlpatterns = [
     path(
         '',
-        views.PostListView.as_view(),
+        post_list,
         name='index'
     ),
     path(
         'posts/<int:post_id>/',
-        views.PostDetailView.as_view(),
+        post_detail,
         name='post_detail'
     ),
     path(
         'category/<slug:category_slug>/',
-        views.CategoryPostsView.as_view(),
+        category_posts,
         name='category_posts'
     ),
+    path(
+        'search/',
+        views.SearchView.as_view(),
+        name='search'
+    ),
     path(
         'profile/<str:username>/',
-        views.ProfileView.as_view(),
+        profile,
         name='profile'
     ),
     path(
@@ -30,6 +47,36 @@ urlpatterns = [
         views.UserEditProfileView.as_view(),
         name='edit_profile'
     ),
+    path(
+        'feeds/rss/',
+        feeds.PostFeed(),
+        name='posts_rss'
+    ),
+    path(
+        'feeds/atom/',
+        feeds.PostAtomFeed(),
+        name='posts_atom'
+    ),
+    path(
+        'category/<slug:category_slug>/rss/',
+        feeds.CategoryPostFeed(),
+        name='category_rss'
+    ),
+    path(
+        'category/<slug:category_slug>/atom/',
+        feeds.CategoryPostAtomFeed(),
+        name='category_atom'
+    ),
+    path(
+        'profile/<str:username>/rss/',
+        feeds.ProfilePostFeed(),
+        name='profile_rss'
+    ),
+    path(
+        'profile/<str:username>/atom/',
+        feeds.ProfilePostAtomFeed(),
+        name='profile_atom'
+    ),
     path(
         'posts/create/',
         views.PostCreateView.as_view(),
@@ -1,3 +1,6 @@
+from urllib.parse import urlencode
+
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.views.generic import DetailView
@@ -5,25 +8,55 @@ from django.urls import reverse_lazy
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic.edit import FormView
 
-from .models import Post, Category, User
+from .models import Post, User
 from .forms import CommentForm
-from .constants import NUMBER_OF_POSTS
-from .mixins import AuthorMixin, PostMixin, CommentMixin
-
-
-class PostListView(ListView):
+from .constants import NUMBER_OF_POSTS, NUMBER_OF_COMMENTS
+from .search import SearchResults, get_search_backend
+from .paginators import CachedCountPaginator, KnownCountPaginator
+from .mixins import (
+    AuthorMixin, PostMixin, CommentMixin, CursorPaginationMixin,
+    CachedObjectMixin, AnonymousCacheMixin, ConditionalGetMixin
+)
+from .catalog import catalog
+from .profiles import get_profile
+from .cache import POSTS_TAG, category_tag, post_tag, profile_tag
+
+
+class PostListView(
+    ConditionalGetMixin, AnonymousCacheMixin, CursorPaginationMixin, ListView
+):
+    use_read_replica = True
+    paginator_class = CachedCountPaginator
     paginate_by = NUMBER_OF_POSTS
     template_name = 'blog/index.html'
     queryset = Post.objects.get_comments_count().filter_posts()
 
+    def get_cache_tags(self):
+        return [POSTS_TAG]
 
-class ProfileView(ListView):
+
+class ProfileView(
+    ConditionalGetMixin, AnonymousCacheMixin, CursorPaginationMixin, ListView
+):
+    use_read_replica = True
+    paginator_class = CachedCountPaginator
     model = Post
     template_name = 'blog/profile.html'
     paginate_by = NUMBER_OF_POSTS
 
-    def get_profile(self, queryset=None):
-        return get_object_or_404(User, username=self.kwargs['username'])
+    def get_cache_tags(self):
+        return [profile_tag(self.kwargs['username'])]
+
+    def get_profile(self):
+        if not hasattr(self, '_profile'):
+            username = self.kwargs['username']
+            if self.request.user.get_username() == username:
+                self._profile = self.request.user
+            else:
+                self._profile = get_profile(username)
+            if self._profile is None:
+                raise Http404('Пользователь не найден.')
+        return self._profile
 
     def get_queryset(self):
         profile = self.get_profile()
@@ -38,6 +71,26 @@ class ProfileView(ListView):
         return context
 
 
+class SearchView(ListView):
+    template_name = 'blog/search.html'
+    paginate_by = NUMBER_OF_POSTS
+
+    def get_query(self):
+        return self.request.GET.get('q', '').strip()
+
+    def get_queryset(self):
+        query = self.get_query()
+        if not query:
+            return SearchResults([])
+        return SearchResults(get_search_backend().search(query))
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['query'] = self.get_query()
+        context['pagination_query'] = urlencode({'q': context['query']}) + '&'
+        return context
+
+
 class UserEditProfileView(LoginRequiredMixin, UpdateView):
     model = User
     template_name = 'blog/user.html'
@@ -53,17 +106,25 @@ class UserEditProfileView(LoginRequiredMixin, UpdateView):
         )
 
 
-class CategoryPostsView(ListView):
+class CategoryPostsView(
+    ConditionalGetMixin, AnonymousCacheMixin, CursorPaginationMixin, ListView
+):
+    use_read_replica = True
+    paginator_class = CachedCountPaginator
     template_name = 'blog/category.html'
-    context_object_name = 'page_obj'
     paginate_by = NUMBER_OF_POSTS
 
-    def get_category(self, quryset=None):
-        return get_object_or_404(
-            Category,
-            slug=self.kwargs['category_slug'],
-            is_published=True
-        )
+    def get_cache_tags(self):
+        return [category_tag(self.kwargs['category_slug'])]
+
+    def get_category(self):
+        if not hasattr(self, '_category'):
+            self._category = catalog.get_published_category(
+                self.kwargs['category_slug']
+            )
+            if self._category is None:
+                raise Http404('Категория не найдена.')
+        return self._category
 
     def get_queryset(self):
         category_posts = self.get_category().posts.get_comments_count(
@@ -105,28 +166,29 @@ class PostDeleteView(PostMixin, DeleteView):
     pass
 
 
-class PostDetailView(DetailView):
+class PostDetailView(
+    ConditionalGetMixin, AnonymousCacheMixin, CachedObjectMixin, DetailView
+):
+    use_read_replica = True
     model = Post
     pk_url_kwarg = 'post_id'
     context_object_name = 'post'
 
-    def get_object(self, queryset=None):
-        post = get_object_or_404(Post, pk=self.kwargs.get('post_id'))
-        if (
-            self.request.user.is_authenticated
-            and self.request.user == post.author
-        ):
-            return post
-        return get_object_or_404(
-            Post.objects.get_comments_count().filter_posts(
-            ).filter(pk=self.kwargs.get('post_id'))
-        )
+    def get_cache_tags(self):
+        return [post_tag(self.kwargs['post_id'])]
+
+    def get_queryset(self):
+        return Post.objects.get_comments_count().visible_to(self.request.user)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = self.get_object().comments.all(
-        ).order_by('created_at')
+        comments = self.object.comments.select_related(
+            'author'
+        ).order_by('created_at', 'id')
+        context['comments'] = KnownCountPaginator(
+            comments, NUMBER_OF_COMMENTS, self.object.comment_count
+        ).get_page(self.request.GET.get('comments_page'))
         return context
 
 
@@ -13,8 +13,12 @@ ALLOWED_HOSTS = [
 
 
 INSTALLED_APPS = [
+    'core.apps.CoreConfig',
     'blog.apps.BlogConfig',
     'pages.apps.PagesConfig',
+    'tasks.apps.TasksConfig',
+    'metrics.apps.MetricsConfig',
+    'api.apps.ApiConfig',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -26,6 +30,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'metrics.middleware.MetricsMiddleware',
+    'core.middleware.ReplicaMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -66,6 +72,31 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+    }
+}
+
+SQLITE_PRAGMAS = {
+    'busy_timeout': 5000,
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 128 * 1024 * 1024,
+    'cache_size': -20000,
+    'temp_store': 'MEMORY',
+}
+
+DATABASE_ROUTERS = ['core.routers.ReplicaRouter']
+
+READ_REPLICAS = []
+
+READ_REPLICA_PIN_SECONDS = 10
+
+READ_REPLICA_PIN_COOKIE = 'read_primary'
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
@@ -113,3 +144,40 @@ LOGIN_REDIRECT_URL = 'blog:index'
 LOGIN_URL = 'login'
 
 MEDIA_ROOT = BASE_DIR / 'media'
+
+BLOG_CURSOR_PAGINATION = False
+
+BLOG_ASYNC_VIEWS = False
+
+BLOG_PAGINATOR_COUNT_TIMEOUT = 60
+
+BLOG_PAGINATOR_APPROXIMATE_THRESHOLD = 10000
+
+BLOG_PAGINATOR_APPROXIMATE_TIMEOUT = 60 * 15
+
+BLOG_PAGE_CACHE_TIMEOUT = 60 * 5
+
+BLOG_SEARCH_BACKEND = None
+
+BLOG_CATALOG_CHECK_INTERVAL = 5
+
+BLOG_PROFILE_CACHE_TIMEOUT = 60 * 60
+
+BLOG_PROFILE_MISSING_TIMEOUT = 60
+
+TASKS_BACKEND = 'tasks.backends.DatabaseBackend'
+
+TASKS_MAX_ATTEMPTS = 3
+
+TASKS_LEASE_SECONDS = 10 * 60
+
+METRICS_WINDOW = 1000
+
+METRICS_SERVER_TIMING = True
+
+METRICS_BUDGETS = {
+    'blog:index': {'queries': 4},
+    'blog:category_posts': {'queries': 4},
+    'blog:profile': {'queries': 4},
+    'blog:post_detail': {'queries': 4},
+}
@@ -8,6 +8,8 @@ urlpatterns = [
     path('auth/', include('django.contrib.auth.urls')),
     path('auth/registration/', include('auth.urls')),
     path('pages/', include('pages.urls')),
+    path('metrics/', include('metrics.urls')),
+    path('api/v1/', include('api.urls')),
     path('', include('blog.urls')),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
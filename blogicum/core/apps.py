@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.core.signals import request_started
+from django.db.backends.signals import connection_created
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from .connections import check_connections, count_opened
+        from .sqlite import configure_sqlite
+        connection_created.connect(configure_sqlite)
+        connection_created.connect(count_opened)
+        request_started.connect(check_connections)
@@ -0,0 +1,63 @@
+import threading
+from collections import defaultdict
+
+from django.db import connections
+
+POOL_EVENTS = ('opened', 'reused', 'discarded')
+
+
+class PoolStats:
+    """Счётчики открытых, переиспользованных и отброшенных соединений."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._threads = defaultdict(dict)
+
+    def add(self, alias, event):
+        thread = threading.current_thread().name
+        with self._lock:
+            counters = self._threads[thread].setdefault(
+                alias, dict.fromkeys(POOL_EVENTS, 0)
+            )
+            counters[event] += 1
+
+    def snapshot(self):
+        with self._lock:
+            threads = {
+                thread: {
+                    alias: dict(counters)
+                    for alias, counters in aliases.items()
+                }
+                for thread, aliases in self._threads.items()
+            }
+        totals = defaultdict(lambda: dict.fromkeys(POOL_EVENTS, 0))
+        for aliases in threads.values():
+            for alias, counters in aliases.items():
+                for event, value in counters.items():
+                    totals[alias][event] += value
+        return {'totals': dict(totals), 'threads': threads}
+
+    def reset(self):
+        with self._lock:
+            self._threads.clear()
+
+
+pool_stats = PoolStats()
+
+
+def count_opened(sender, connection, **kwargs):
+    pool_stats.add(connection.alias, 'opened')
+
+
+def check_connections(**kwargs):
+    for connection in connections.all():
+        if connection.connection is None:
+            continue
+        if (
+            connection.settings_dict.get('CONN_HEALTH_CHECKS')
+            and not connection.is_usable()
+        ):
+            connection.close()
+            pool_stats.add(connection.alias, 'discarded')
+        else:
+            pool_stats.add(connection.alias, 'reused')
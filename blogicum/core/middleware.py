@@ -0,0 +1,61 @@
+import asyncio
+
+from django.conf import settings
+
+from .routers import ReplicaState, replica_state
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        state = self.start(request)
+        token = replica_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            replica_state.reset(token)
+        return self.pin(state, response)
+
+    async def __acall__(self, request):
+        state = self.start(request)
+        token = replica_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            replica_state.reset(token)
+        return self.pin(state, response)
+
+    def start(self, request):
+        request.replica_state = ReplicaState(
+            pinned=settings.READ_REPLICA_PIN_COOKIE in request.COOKIES
+        )
+        return request.replica_state
+
+    def pin(self, state, response):
+        if state.written:
+            response.set_cookie(
+                settings.READ_REPLICA_PIN_COOKIE,
+                '1',
+                max_age=settings.READ_REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax'
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = getattr(view_func, 'view_class', view_func)
+        request.replica_state.use_replica = (
+            request.method in SAFE_METHODS
+            and getattr(view, 'use_read_replica', False)
+        )
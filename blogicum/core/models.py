@@ -21,3 +21,13 @@ class CreatedModel(models.Model):
     class Meta:
         abstract = True
         ordering = ('created_at',)
+
+
+class UpdatedModel(models.Model):
+    updated_at = models.DateTimeField(
+        'Изменено',
+        auto_now=True
+    )
+
+    class Meta:
+        abstract = True
@@ -0,0 +1,59 @@
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+PRIMARY_ONLY_APPS = ('sessions',)
+
+replica_state = ContextVar('replica_state', default=None)
+
+
+class ReplicaState:
+    def __init__(self, pinned=False):
+        self.pinned = pinned
+        self.use_replica = False
+        self.written = False
+
+
+def get_instance_db(hints):
+    instance = hints.get('instance')
+    return instance._state.db if instance is not None else None
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        instance_db = get_instance_db(hints)
+        if instance_db is not None:
+            return instance_db
+        state = replica_state.get()
+        if (
+            not settings.READ_REPLICAS
+            or state is None
+            or not state.use_replica
+            or state.pinned
+            or state.written
+            or model._meta.app_label in PRIMARY_ONLY_APPS
+        ):
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.READ_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        state = replica_state.get()
+        if state is not None:
+            state.written = True
+        instance_db = get_instance_db(hints)
+        if instance_db is None or instance_db in settings.READ_REPLICAS:
+            return DEFAULT_DB_ALIAS
+        return instance_db
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, *settings.READ_REPLICAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.READ_REPLICAS:
+            return False
+        return None
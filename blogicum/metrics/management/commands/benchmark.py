@@ -0,0 +1,194 @@
+import json
+import time
+import tracemalloc
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext, setup_test_environment, teardown_test_environment
+)
+from django.urls import reverse
+
+from auth import urls as auth_urls
+from blog import urls as blog_urls
+from blog.models import Comment, Post
+from metrics.stats import percentile
+from pages import urls as pages_urls
+
+User = get_user_model()
+
+SEED_OPTIONS = (
+    'users', 'categories', 'locations', 'posts', 'comments', 'seed'
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Заполняет тестовую базу синтетическими данными, замеряет '
+        'задержку, число запросов и память для каждого маршрута блога '
+        'и сравнивает результат с сохранённым эталоном.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=20)
+        parser.add_argument('--categories', type=int, default=5)
+        parser.add_argument('--locations', type=int, default=5)
+        parser.add_argument('--posts', type=int, default=1000)
+        parser.add_argument('--comments', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=20,
+            help='Сколько раз запрашивать каждый маршрут.'
+        )
+        parser.add_argument(
+            '--anonymous',
+            action='store_true',
+            help='Запрашивать страницы без авторизации.'
+        )
+        parser.add_argument(
+            '--output',
+            help='Куда записать результаты в формате JSON.'
+        )
+        parser.add_argument(
+            '--baseline',
+            help='JSON с эталонными результатами для сравнения.'
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.25,
+            help='Допустимый относительный рост p95 по сравнению с эталоном.'
+        )
+        parser.add_argument(
+            '--use-current-db',
+            action='store_true',
+            help='Не создавать отдельную тестовую базу.'
+        )
+
+    def handle(self, *args, **options):
+        if options['use_current_db']:
+            results = self.run(options)
+        else:
+            setup_test_environment(debug=False)
+            old_name = connection.creation.create_test_db(
+                verbosity=0, autoclobber=True
+            )
+            try:
+                results = self.run(options)
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+                teardown_test_environment()
+        self.report(results)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                json.dump(results, file, ensure_ascii=False, indent=2)
+        if options['baseline']:
+            self.compare(results, options['baseline'], options['threshold'])
+
+    def run(self, options):
+        call_command(
+            'seed_blog',
+            stdout=self.stdout,
+            **{name: options[name] for name in SEED_OPTIONS}
+        )
+        post = Post.objects.filter_posts().select_related(
+            'author', 'category'
+        ).first()
+        if post is None:
+            raise CommandError('Нет публикаций для замеров.')
+        comment, _ = Comment.objects.get_or_create(
+            post=post, author=post.author, defaults={'text': 'Комментарий'}
+        )
+        client = Client()
+        if not options['anonymous']:
+            client.force_login(post.author)
+        kwargs = {
+            'post_id': post.pk,
+            'category_slug': post.category.slug,
+            'username': post.author.username,
+            'comment_id': comment.pk,
+        }
+        cache.clear()
+        return {
+            url_name: self.measure(client, url, options['requests'])
+            for url_name, url in self.get_urls(kwargs)
+        }
+
+    def get_urls(self, kwargs):
+        for module in (blog_urls, pages_urls, auth_urls):
+            namespace = getattr(module, 'app_name', None)
+            for pattern in module.urlpatterns:
+                if not pattern.name:
+                    continue
+                url_name = (
+                    f'{namespace}:{pattern.name}' if namespace
+                    else pattern.name
+                )
+                yield url_name, reverse(url_name, kwargs={
+                    name: kwargs[name]
+                    for name in pattern.pattern.converters
+                })
+
+    def measure(self, client, url, requests):
+        timings, queries = [], []
+        for _ in range(requests):
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = client.get(url)
+                timings.append((time.perf_counter() - start) * 1000)
+            queries.append(len(captured))
+        tracemalloc.start()
+        client.get(url)
+        memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return {
+            'url': url,
+            'status': response.status_code,
+            'p50': round(percentile(timings, 50), 2),
+            'p95': round(percentile(timings, 95), 2),
+            'p99': round(percentile(timings, 99), 2),
+            'queries': max(queries),
+            'memory_kb': round(memory / 1024, 1),
+        }
+
+    def report(self, results):
+        self.stdout.write(
+            f'{"маршрут":<24}{"код":>5}{"p50":>9}{"p95":>9}{"p99":>9}'
+            f'{"запросы":>9}{"память КБ":>11}'
+        )
+        for url_name, result in results.items():
+            self.stdout.write(
+                f'{url_name:<24}{result["status"]:>5}{result["p50"]:>9}'
+                f'{result["p95"]:>9}{result["p99"]:>9}'
+                f'{result["queries"]:>9}{result["memory_kb"]:>11}'
+            )
+
+    def compare(self, results, baseline_path, threshold):
+        with open(baseline_path, encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = []
+        for url_name, expected in baseline.items():
+            actual = results.get(url_name)
+            if actual is None:
+                continue
+            if actual['p95'] > expected['p95'] * (1 + threshold):
+                regressions.append(
+                    f'{url_name}: p95 {actual["p95"]} мс '
+                    f'(эталон {expected["p95"]} мс)'
+                )
+            if actual['queries'] > expected['queries']:
+                regressions.append(
+                    f'{url_name}: {actual["queries"]} запросов '
+                    f'(эталон {expected["queries"]})'
+                )
+        if regressions:
+            raise CommandError(
+                'Обнаружена деградация:\n' + '\n'.join(regressions)
+            )
+        self.stdout.write(self.style.SUCCESS('Деградаций не обнаружено.'))
@@ -0,0 +1,200 @@
+import json
+import random
+import shutil
+import tempfile
+import threading
+import time
+from functools import partial
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections
+from django.db.models import F
+from django.test import override_settings
+from django.utils import timezone
+
+from blog.models import Category, Comment, Post
+
+User = get_user_model()
+
+BENCH_ALIAS = 'sqlite_benchmark'
+
+MODES = {
+    'default': {},
+    'tuned': None,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Сравнивает пропускную способность SQLite со стандартными и '
+        'настроенными параметрами (SQLITE_PRAGMAS) при одновременной '
+        'работе читателей и писателей.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=4)
+        parser.add_argument('--writers', type=int, default=4)
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=5,
+            help='Длительность каждого прогона в секундах.'
+        )
+        parser.add_argument('--posts', type=int, default=200)
+        parser.add_argument(
+            '--output',
+            help='Куда записать результаты в формате JSON.'
+        )
+
+    def handle(self, *args, **options):
+        workdir = Path(tempfile.mkdtemp())
+        try:
+            template = workdir / 'template.sqlite3'
+            self.prepare(template, options['posts'])
+            results = {}
+            for mode, pragmas in MODES.items():
+                path = workdir / f'{mode}.sqlite3'
+                shutil.copy(template, path)
+                results[mode] = self.run(path, pragmas, options)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        for mode, result in results.items():
+            self.stdout.write(
+                f'{mode:<8} чтений/с {result["reads_per_second"]:>9.1f}  '
+                f'записей/с {result["writes_per_second"]:>8.1f}  '
+                f'блокировок {result["locked"]}'
+            )
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                json.dump(results, file, ensure_ascii=False, indent=2)
+        self.stdout.write(self.style.SUCCESS('Замер завершён.'))
+
+    def connect(self, path):
+        connections.databases[BENCH_ALIAS] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': str(path),
+        }
+
+    def disconnect(self):
+        connections[BENCH_ALIAS].close()
+        del connections[BENCH_ALIAS]
+        del connections.databases[BENCH_ALIAS]
+
+    def prepare(self, path, posts):
+        self.connect(path)
+        try:
+            with override_settings(SQLITE_PRAGMAS={}):
+                call_command(
+                    'migrate', database=BENCH_ALIAS, verbosity=0
+                )
+                author = User.objects.db_manager(BENCH_ALIAS).create_user(
+                    'benchmark'
+                )
+                category = Category.objects.using(BENCH_ALIAS).create(
+                    title='Замер', description='Замер', slug='benchmark'
+                )
+                Post.objects.using(BENCH_ALIAS).bulk_create(
+                    Post(
+                        title=f'Публикация {i}', text='Текст',
+                        pub_date=timezone.now(), author=author,
+                        category=category, is_visible=True
+                    )
+                    for i in range(posts)
+                )
+        finally:
+            self.disconnect()
+
+    def run(self, path, pragmas, options):
+        overrides = {} if pragmas is None else {'SQLITE_PRAGMAS': pragmas}
+        counters = Counters()
+        stop = threading.Event()
+        self.connect(path)
+        try:
+            with override_settings(**overrides):
+                author = User.objects.using(BENCH_ALIAS).get()
+                post_ids = list(
+                    Post.objects.using(BENCH_ALIAS).values_list(
+                        'pk', flat=True
+                    )
+                )
+                threads = [
+                    threading.Thread(
+                        target=worker,
+                        args=(read_posts, 'reads', stop, counters)
+                    )
+                    for _ in range(options['readers'])
+                ] + [
+                    threading.Thread(
+                        target=worker,
+                        args=(
+                            partial(
+                                write_comment, author,
+                                post_ids[number::options['writers']]
+                                or post_ids
+                            ),
+                            'writes', stop, counters
+                        )
+                    )
+                    for number in range(options['writers'])
+                ]
+                start = time.perf_counter()
+                for thread in threads:
+                    thread.start()
+                time.sleep(options['duration'])
+                stop.set()
+                for thread in threads:
+                    thread.join()
+                elapsed = time.perf_counter() - start
+        finally:
+            self.disconnect()
+        return {
+            'reads_per_second': round(counters.reads / elapsed, 1),
+            'writes_per_second': round(counters.writes / elapsed, 1),
+            'locked': counters.locked,
+        }
+
+
+class Counters:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reads = 0
+        self.writes = 0
+        self.locked = 0
+
+    def add(self, key):
+        with self.lock:
+            setattr(self, key, getattr(self, key) + 1)
+
+
+def read_posts():
+    list(
+        Post.objects.using(BENCH_ALIAS).select_related(
+            'author', 'category'
+        ).filter_posts()[:10]
+    )
+
+
+def write_comment(author, post_ids):
+    post_id = random.choice(post_ids)
+    Comment.objects.using(BENCH_ALIAS).bulk_create([
+        Comment(text='Комментарий', post_id=post_id, author=author)
+    ])
+    Post.objects.using(BENCH_ALIAS).filter(pk=post_id).update(
+        comment_count=F('comment_count') + 1
+    )
+
+
+def worker(action, key, stop, counters):
+    try:
+        while not stop.is_set():
+            try:
+                action()
+            except OperationalError:
+                counters.add('locked')
+            else:
+                counters.add(key)
+    finally:
+        connections[BENCH_ALIAS].close()
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+from .stats import RollingStats
+
+logger = logging.getLogger('metrics')
+
+stats = RollingStats(settings.METRICS_WINDOW)
+
+current_counter = ContextVar('current_counter', default=None)
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            with self.lock:
+                self.duration += time.perf_counter() - start
+                self.count += 1
+
+
+@contextmanager
+def track_queries(counter=None):
+    """Считает запросы всех соединений текущего потока.
+
+    Без аргумента берёт счётчик запроса из контекста, поэтому работает
+    и в рабочих потоках sync_to_async.
+    """
+    counter = counter or current_counter.get()
+    with ExitStack() as stack:
+        if counter is not None:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+        yield counter
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        counter = QueryCounter()
+        request._render_time = 0
+        start = time.perf_counter()
+        token = current_counter.set(counter)
+        try:
+            with track_queries(counter):
+                response = self.get_response(request)
+        finally:
+            current_counter.reset(token)
+        return self.measure(request, response, counter, start)
+
+    async def __acall__(self, request):
+        """Запросы считаются в потоках sync_to_async через контекст."""
+        counter = QueryCounter()
+        request._render_time = 0
+        start = time.perf_counter()
+        token = current_counter.set(counter)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_counter.reset(token)
+        return self.measure(request, response, counter, start)
+
+    def measure(self, request, response, counter, start):
+        total = time.perf_counter() - start
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else 'unresolved'
+        sample = {
+            'total': round(total * 1000, 2),
+            'db': round(counter.duration * 1000, 2),
+            'render': round(request._render_time * 1000, 2),
+            'queries': counter.count,
+        }
+        stats.record(view_name, **sample)
+        self.check_budget(view_name, sample)
+        if settings.METRICS_SERVER_TIMING:
+            response['Server-Timing'] = ', '.join((
+                f'db;dur={sample["db"]};desc="{sample["queries"]} queries"',
+                f'render;dur={sample["render"]}',
+                f'total;dur={sample["total"]}',
+            ))
+        return response
+
+    def process_template_response(self, request, response):
+        start = time.perf_counter()
+
+        def stop_timer(rendered):
+            request._render_time += time.perf_counter() - start
+
+        response.add_post_render_callback(stop_timer)
+        return response
+
+    def check_budget(self, view_name, sample):
+        budget = settings.METRICS_BUDGETS.get(view_name, {})
+        for metric, limit in budget.items():
+            if sample[metric] > limit:
+                logger.warning(
+                    'Превышен бюджет %s для %s: %s > %s',
+                    metric, view_name, sample[metric], limit
+                )
@@ -0,0 +1,59 @@
+import threading
+from collections import deque
+
+METRICS = ('total', 'db', 'render', 'queries')
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values, rank):
+    if not values:
+        return 0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(rank / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+class RollingStats:
+    """Скользящее окно последних замеров по каждому представлению."""
+
+    def __init__(self, window):
+        self.window = window
+        self._samples = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, view_name, **sample):
+        with self._lock:
+            if view_name not in self._samples:
+                self._samples[view_name] = deque(maxlen=self.window)
+                self._counts[view_name] = 0
+            self._samples[view_name].append(sample)
+            self._counts[view_name] += 1
+
+    def snapshot(self):
+        with self._lock:
+            samples = {
+                view_name: list(values)
+                for view_name, values in self._samples.items()
+            }
+            counts = dict(self._counts)
+        return {
+            view_name: {
+                'requests': counts[view_name],
+                **{
+                    metric: {
+                        f'p{rank}': percentile(
+                            [sample[metric] for sample in values], rank
+                        )
+                        for rank in PERCENTILES
+                    }
+                    for metric in METRICS
+                },
+            }
+            for view_name, values in samples.items()
+        }
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
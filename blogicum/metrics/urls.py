@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import views
+
+app_name = 'metrics'
+
+urlpatterns = [
+    path('', views.metrics_stats, name='stats'),
+    path('connections/', views.connection_stats, name='connections'),
+]
@@ -0,0 +1,16 @@
+from django.http import Http404, JsonResponse
+
+from core.connections import pool_stats
+from .middleware import stats
+
+
+def metrics_stats(request):
+    if not request.user.is_staff:
+        raise Http404
+    return JsonResponse(stats.snapshot())
+
+
+def connection_stats(request):
+    if not request.user.is_staff:
+        raise Http404
+    return JsonResponse(pool_stats.snapshot())
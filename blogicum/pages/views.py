@@ -3,10 +3,12 @@ from django.views.generic import TemplateView
 
 
 class About(TemplateView):
+    use_read_replica = True
     template_name = 'pages/about.html'
 
 
 class Rules(TemplateView):
+    use_read_replica = True
     template_name = 'pages/rules.html'
 
 
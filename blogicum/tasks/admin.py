@@ -0,0 +1,20 @@
+from django.contrib import admin
+
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = (
+        'name',
+        'status',
+        'attempts',
+        'created_at',
+        'started_at',
+    )
+    list_filter = (
+        'status',
+    )
+    readonly_fields = (
+        'error',
+    )
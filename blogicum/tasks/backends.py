@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .models import Task
+
+
+class ImmediateBackend:
+    def enqueue(self, name, *args):
+        import_string(name)(*args)
+
+
+class DatabaseBackend:
+    def enqueue(self, name, *args):
+        return Task.objects.create(name=name, args=list(args))
+
+
+def enqueue(name, *args):
+    return import_string(settings.TASKS_BACKEND)().enqueue(name, *args)
@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = 'Выполняет задачи из очереди фоновых задач.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Выполнить накопившиеся задачи и завершиться.'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1,
+            help='Пауза в секундах, когда очередь пуста.'
+        )
+        parser.add_argument(
+            '--batch',
+            type=int,
+            default=20,
+            help='Сколько задач забирать из очереди за раз.'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            done = self.run_batch(options['batch'])
+            if not done:
+                if options['once']:
+                    return
+                time.sleep(options['interval'])
+
+    def run_batch(self, size):
+        Task.release_stale()
+        tasks = Task.objects.filter(
+            status=Task.PENDING
+        ).order_by('created_at')[:size]
+        done = 0
+        for task in tasks:
+            if task.claim():
+                task.run()
+                done += 1
+                self.stdout.write(f'{task}')
+        return done
@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from core.models import CreatedModel
+
+NAME_MAX_LENGTH = 256
+
+
+class Task(CreatedModel):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUSES = (
+        (PENDING, 'В очереди'),
+        (RUNNING, 'Выполняется'),
+        (DONE, 'Выполнена'),
+        (FAILED, 'Ошибка'),
+    )
+
+    name = models.CharField('Функция', max_length=NAME_MAX_LENGTH)
+    args = models.JSONField('Аргументы', default=list, blank=True)
+    status = models.CharField(
+        'Статус',
+        max_length=16,
+        choices=STATUSES,
+        default=PENDING
+    )
+    attempts = models.PositiveSmallIntegerField('Попытки', default=0)
+    started_at = models.DateTimeField(
+        'Начало выполнения',
+        null=True,
+        blank=True
+    )
+    error = models.TextField('Последняя ошибка', blank=True)
+
+    class Meta(CreatedModel.Meta):
+        verbose_name = 'задача'
+        verbose_name_plural = 'Задачи'
+        indexes = (
+            models.Index(
+                fields=('created_at',),
+                condition=models.Q(status='pending'),
+                name='task_pending_idx'
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.name} ({self.get_status_display()})'
+
+    def claim(self):
+        claimed = Task.objects.filter(pk=self.pk, status=self.PENDING).update(
+            status=self.RUNNING,
+            attempts=models.F('attempts') + 1,
+            started_at=timezone.now()
+        )
+        if claimed:
+            self.refresh_from_db(fields=('status', 'attempts', 'started_at'))
+        return bool(claimed)
+
+    @classmethod
+    def release_stale(cls):
+        """Возвращает в очередь задачи упавших обработчиков."""
+        stale = cls.objects.filter(
+            status=cls.RUNNING,
+            started_at__lt=timezone.now() - timedelta(
+                seconds=settings.TASKS_LEASE_SECONDS
+            )
+        )
+        error = 'Обработчик не завершил задачу вовремя.'
+        failed = stale.filter(
+            attempts__gte=settings.TASKS_MAX_ATTEMPTS
+        ).update(status=cls.FAILED, error=error)
+        released = stale.update(status=cls.PENDING, error=error)
+        return released + failed
+
+    def run(self):
+        try:
+            import_string(self.name)(*self.args)
+        except Exception as error:
+            self.error = repr(error)
+            self.status = (
+                self.PENDING
+                if self.attempts < settings.TASKS_MAX_ATTEMPTS
+                else self.FAILED
+            )
+        else:
+            self.error = ''
+            self.status = self.DONE
+        self.save(update_fields=('status', 'error'))
+        return self.status == self.DONE
@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+
+from blog.constants import NUMBER_OF_POSTS
+from blog.models import Post
+from blog.paginators import NEXT, PREVIOUS, CursorPaginator
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def visible_posts(mixer, user, published_category):
+    now = timezone.now()
+    return mixer.cycle(NUMBER_OF_POSTS + 2).blend(
+        'blog.Post', author=user, category=published_category,
+        location=None, is_published=True,
+        pub_date=mixer.sequence(
+            *(now - timedelta(hours=1 + i) for i in range(NUMBER_OF_POSTS + 2))
+        )
+    )
+
+
+def test_api_index_cursor_pagination(client, visible_posts):
+    with CaptureQueriesContext(connection) as queries:
+        data = client.get('/api/v1/').json()
+    assert len(data['results']) == NUMBER_OF_POSTS
+    assert data['previous'] is None
+    assert data['results'][0]['id'] == visible_posts[0].id
+    assert data['results'][0]['author'] == visible_posts[0].author.username
+    assert 'text' not in data['results'][0], (
+        'Убедитесь, что список публикаций в API не загружает текст.'
+    )
+    assert '"text"' not in queries.captured_queries[-1]['sql']
+    second = client.get(data['next']).json()
+    assert [post['id'] for post in second['results']] == [
+        post.id for post in visible_posts[NUMBER_OF_POSTS:]
+    ]
+    assert second['next'] is None
+
+
+def test_api_etag_and_not_modified(client, visible_posts):
+    response = client.get('/api/v1/')
+    assert response.status_code == 200
+    etag = response['ETag']
+    assert etag.startswith('"')
+    assert 'Last-Modified' not in response, (
+        'Убедитесь, что API не отдаёт заголовок Last-Modified.'
+    )
+    cached = client.get('/api/v1/', HTTP_IF_NONE_MATCH=etag)
+    assert cached.status_code == 304
+    assert not cached.content
+    post = visible_posts[0]
+    post.title = 'Новый заголовок'
+    post.save()
+    assert client.get(
+        '/api/v1/', HTTP_IF_NONE_MATCH=etag
+    ).status_code == 200
+
+
+def test_api_unpublished_newest_post_is_not_cached(client, visible_posts):
+    since = http_date(timezone.now().timestamp())
+    newest = visible_posts[0]
+    newest.is_published = False
+    newest.save()
+    refreshed = client.get('/api/v1/', HTTP_IF_MODIFIED_SINCE=since)
+    assert refreshed.status_code == 200, (
+        'Убедитесь, что после снятия новой публикации с публикации '
+        'API не отвечает 304.'
+    )
+    assert newest.id not in [
+        post['id'] for post in refreshed.json()['results']
+    ]
+
+
+def test_api_cursor_past_either_end_is_not_found(client, visible_posts):
+    paginator = CursorPaginator(Post.objects.filter_posts(), NUMBER_OF_POSTS)
+    for cursor in (
+        paginator.encode_cursor(NEXT, visible_posts[-1]),
+        paginator.encode_cursor(PREVIOUS, visible_posts[0]),
+    ):
+        assert client.get(
+            '/api/v1/', {'cursor': cursor}
+        ).status_code == 404, (
+            'Убедитесь, что курсор за границей ленты в API возвращает 404.'
+        )
+
+
+def test_api_category_and_profile(client, user, visible_posts,
+                                  published_category):
+    data = client.get(f'/api/v1/category/{published_category.slug}/').json()
+    assert data['category']['slug'] == published_category.slug
+    assert len(data['results']) == NUMBER_OF_POSTS
+    assert client.get('/api/v1/category/missing/').status_code == 404
+    data = client.get(f'/api/v1/profile/{user.username}/').json()
+    assert data['profile']['username'] == user.username
+    assert client.get('/api/v1/profile/missing_user/').status_code == 404
+
+
+def test_api_post_detail(client, mixer, visible_posts):
+    post = visible_posts[0]
+    mixer.cycle(2).blend('blog.Comment', post=post)
+    data = client.get(f'/api/v1/posts/{post.id}/').json()
+    assert data['text'] == post.text
+    assert len(data['comments']) == 2
+    assert data['comments_next'] is None
+    assert client.get('/api/v1/posts/0/').status_code == 404
+    assert client.post(f'/api/v1/posts/{post.id}/').status_code == 405
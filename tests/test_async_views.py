@@ -0,0 +1,169 @@
+import asyncio
+import importlib
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404
+from django.test import AsyncClient, RequestFactory, override_settings
+from django.urls import clear_url_caches, resolve
+from django.utils import timezone
+
+from blog import async_views
+from core.middleware import ReplicaMiddleware
+from metrics.middleware import MetricsMiddleware, stats
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.usefixtures('no_page_cache'),
+]
+
+
+@pytest.fixture
+def no_page_cache():
+    with override_settings(BLOG_PAGE_CACHE_TIMEOUT=0):
+        yield
+
+
+def call_view(view, path, user=None, **kwargs):
+    request = RequestFactory().get(path)
+    request.user = user or AnonymousUser()
+    request.resolver_match = resolve(request.path)
+    response = async_to_sync(view)(request, **kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    return response
+
+
+@pytest.fixture
+def async_urls():
+    def reload_urls():
+        for module in ('blog.urls', 'blogicum.urls'):
+            importlib.reload(importlib.import_module(module))
+        clear_url_caches()
+
+    with override_settings(BLOG_ASYNC_VIEWS=True):
+        reload_urls()
+        yield
+    reload_urls()
+
+
+@pytest.fixture
+def visible_posts(mixer, user, published_category):
+    return mixer.cycle(3).blend(
+        'blog.Post', author=user, category=published_category,
+        location=None, is_published=True,
+        pub_date=timezone.now() - timedelta(hours=1)
+    )
+
+
+def test_gather_runs_concurrently():
+    start = time.perf_counter()
+    results = async_to_sync(async_views.gather)(
+        lambda: time.sleep(0.2) or 1,
+        lambda: time.sleep(0.2) or 2,
+    )
+    assert results == [1, 2]
+    assert time.perf_counter() - start < 0.35, (
+        'Убедитесь, что независимые запросы выполняются одновременно.'
+    )
+
+
+def test_async_post_list(visible_posts):
+    response = call_view(async_views.post_list, '/')
+    assert response.status_code == 200
+    content = response.content.decode()
+    for post in visible_posts:
+        assert post.title in content
+
+
+def test_async_category_posts(visible_posts, published_category):
+    response = call_view(
+        async_views.category_posts,
+        f'/category/{published_category.slug}/',
+        category_slug=published_category.slug
+    )
+    assert published_category.title in response.content.decode()
+    with pytest.raises(Http404):
+        call_view(
+            async_views.category_posts, '/category/missing/',
+            category_slug='missing'
+        )
+
+
+def test_async_profile_shows_hidden_posts_to_owner(mixer, user, visible_posts):
+    hidden = mixer.blend(
+        'blog.Post', author=user, is_published=False, location=None
+    )
+    path = f'/profile/{user.username}/'
+    anonymous = call_view(async_views.profile, path, username=user.username)
+    assert hidden.title not in anonymous.content.decode()
+    owner = call_view(
+        async_views.profile, path, user=user, username=user.username
+    )
+    assert hidden.title in owner.content.decode()
+
+
+def test_async_post_detail(mixer, visible_posts):
+    post = visible_posts[0]
+    comment = mixer.blend(
+        'blog.Comment', post=post, text='Комментарий к публикации'
+    )
+    response = call_view(
+        async_views.post_detail, f'/posts/{post.id}/?comments_page=9',
+        post_id=post.id
+    )
+    content = response.content.decode()
+    assert post.title in content
+    assert comment.text in content
+    with pytest.raises(Http404):
+        call_view(
+            async_views.post_detail, '/posts/0/', post_id=0
+        )
+
+
+def test_async_views_are_measured(client, async_urls, visible_posts):
+    stats.reset()
+    response = client.get('/')
+    assert response.status_code == 200
+    assert visible_posts[0].title in response.content.decode()
+    sample = stats.snapshot()['blog:index']
+    assert sample['queries']['p50'] > 0, (
+        'Убедитесь, что запросы асинхронных представлений попадают '
+        'в метрики.'
+    )
+    assert sample['render']['p50'] > 0
+    assert '0 queries' not in response['Server-Timing']
+
+
+def test_async_views_run_through_async_middleware(async_urls, visible_posts,
+                                                  monkeypatch):
+    record = stats.record
+    threads = []
+
+    def record_thread(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return record(*args, **kwargs)
+
+    async def fetch():
+        response = await AsyncClient().get('/')
+        return threading.current_thread(), response
+
+    monkeypatch.setattr(stats, 'record', record_thread)
+    with override_settings(MIDDLEWARE=[
+        middleware for middleware in settings.MIDDLEWARE
+        if not middleware.startswith('debug_toolbar.')
+    ]):
+        loop_thread, response = async_to_sync(fetch)()
+    assert response.status_code == 200
+    assert threads == [loop_thread], (
+        'Убедитесь, что MetricsMiddleware выполняется в цикле событий, '
+        'не занимая поток на запрос.'
+    )
+    assert '0 queries' not in response['Server-Timing']
+    assert asyncio.iscoroutinefunction(ReplicaMiddleware(fetch))
+    assert asyncio.iscoroutinefunction(MetricsMiddleware(fetch))
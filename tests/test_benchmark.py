@@ -0,0 +1,69 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from blog.models import Category, Comment, Post
+from blog.search import get_search_backend
+
+pytestmark = [pytest.mark.django_db]
+
+BENCHMARK_OPTIONS = dict(
+    users=3, categories=2, locations=2, posts=15, comments=30, requests=2,
+    use_current_db=True,
+)
+
+
+def test_seed_blog():
+    call_command(
+        'seed_blog', users=2, categories=1, locations=1, posts=5,
+        comments=10, stdout=StringIO()
+    )
+    assert Post.objects.filter_posts().count() == 5
+    assert sum(
+        Post.objects.values_list('comment_count', flat=True)
+    ) == Comment.objects.count() == 10
+    post = Post.objects.first()
+    assert post.pk in get_search_backend().search(post.title.split()[0]), (
+        'Убедитесь, что `seed_blog` добавляет публикации в поисковый индекс.'
+    )
+
+
+def test_seed_blog_respects_visibility_and_reruns():
+    options = dict(
+        users=2, categories=1, locations=1, posts=5, comments=0,
+        stdout=StringIO()
+    )
+    call_command('seed_blog', **options)
+    for category in Category.objects.all():
+        category.is_published = False
+        category.save()
+    call_command('seed_blog', **options)
+    assert Post.objects.count() == 10, (
+        'Убедитесь, что `seed_blog` можно повторно запустить с тем же '
+        'зерном.'
+    )
+    assert not Post.objects.filter_posts().exists(), (
+        'Убедитесь, что публикации в скрытых категориях не попадают '
+        'в ленту.'
+    )
+
+
+def test_benchmark_covers_routes_and_detects_regressions(tmp_path):
+    output = tmp_path / 'baseline.json'
+    call_command('benchmark', output=str(output), stdout=StringIO(),
+                 **BENCHMARK_OPTIONS)
+    results = json.loads(output.read_text(encoding='utf-8'))
+    assert {
+        'blog:index', 'blog:post_detail', 'blog:category_posts',
+        'blog:profile', 'pages:about', 'pages:rules', 'registration',
+    } <= set(results)
+    assert all(result['status'] == 200 for result in results.values())
+
+    for result in results.values():
+        result['queries'] = 0
+    output.write_text(json.dumps(results), encoding='utf-8')
+    with pytest.raises(CommandError):
+        call_command('benchmark', baseline=str(output), seed=1,
+                     stdout=StringIO(), **BENCHMARK_OPTIONS)
@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+import pytest
+from django.core.paginator import EmptyPage, Paginator
+from django.db import connection
+from django.template.loader import render_to_string
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from blog.models import Post
+from blog.paginators import CachedCountPaginator
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def make_posts(mixer, user, published_category):
+    def make(count):
+        return mixer.cycle(count).blend(
+            'blog.Post', author=user, category=published_category,
+            location=None, is_published=True,
+            pub_date=timezone.now() - timedelta(hours=1)
+        )
+    return make
+
+
+def get_count():
+    paginator = CachedCountPaginator(Post.objects.filter_posts(), 10)
+    with CaptureQueriesContext(connection) as queries:
+        count = paginator.count
+    return count, len(queries), paginator.approximate
+
+
+def test_count_is_cached_and_invalidated(make_posts):
+    make_posts(3)
+    assert get_count() == (3, 1, False)
+    assert get_count() == (3, 0, False), (
+        'Убедитесь, что число публикаций берётся из кеша.'
+    )
+    make_posts(1)
+    assert get_count() == (4, 1, False), (
+        'Убедитесь, что кешированное число сбрасывается при изменении '
+        'публикаций.'
+    )
+
+
+def test_large_count_is_approximate(make_posts, settings):
+    settings.BLOG_PAGINATOR_APPROXIMATE_THRESHOLD = 2
+    make_posts(3)
+    assert get_count() == (3, 1, True)
+    make_posts(2)
+    assert get_count() == (3, 0, True)
+    paginator = CachedCountPaginator(Post.objects.filter_posts(), 2)
+    assert len(paginator.page(2).object_list) == 2, (
+        'Убедитесь, что приблизительное число не обрезает страницу.'
+    )
+    assert paginator.page(2).has_next()
+    last = paginator.page(3)
+    assert len(last.object_list) == 1, (
+        'Убедитесь, что страницы за устаревшим числом публикаций '
+        'доступны.'
+    )
+    assert not last.has_next()
+    with pytest.raises(EmptyPage):
+        paginator.page(4)
+
+
+def test_stale_approximate_count_in_views(make_posts, client, settings):
+    settings.BLOG_PAGINATOR_APPROXIMATE_THRESHOLD = 2
+    make_posts(3)
+    client.get('/')
+    make_posts(10)
+    assert client.get('/?page=2').status_code == 200
+    assert client.get('/?page=3').status_code == 404
+
+
+def test_paginator_renders_elided_range():
+    page = Paginator(range(10000), 10).page(500)
+    html = render_to_string(
+        'includes/paginator.html', {'page_obj': page}
+    )
+    assert '…' in html
+    assert html.count('class="page-item') < 15, (
+        'Убедитесь, что пагинатор не выводит ссылку на каждую страницу.'
+    )
+    for number in (1, 499, 500, 501, 1000):
+        assert f'page={number}"' in html or f'>{number}<' in html
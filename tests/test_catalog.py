@@ -0,0 +1,61 @@
+import pytest
+
+from blog.cache import CATALOG_TAG, invalidate
+from blog.catalog import catalog
+from blog.models import Category, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_catalog_refreshed_by_signals(published_category):
+    assert catalog.get_category_by_slug(published_category.slug)
+    published_category.title = 'Новое название'
+    published_category.save()
+    assert catalog.get_category(published_category.pk).title == (
+        'Новое название'
+    ), 'Убедитесь, что каталог обновляется при сохранении категории.'
+    published_category.delete()
+    assert catalog.get_category_by_slug(published_category.slug) is None
+
+
+def test_catalog_follows_shared_version(published_category, settings):
+    settings.BLOG_CATALOG_CHECK_INTERVAL = 0
+    catalog.get_data()
+    Category.objects.filter(pk=published_category.pk).update(
+        title='Изменено в другом процессе'
+    )
+    assert catalog.get_category(published_category.pk).title != (
+        'Изменено в другом процессе'
+    )
+    invalidate(CATALOG_TAG)
+    assert catalog.get_category(published_category.pk).title == (
+        'Изменено в другом процессе'
+    )
+
+
+def test_unpublished_category_not_served(client, mixer):
+    category = mixer.blend('blog.Category', is_published=False)
+    assert client.get(f'/category/{category.slug}/').status_code == 404
+
+
+def test_catalog_attached_when_iterating(
+        post_with_published_location, django_assert_num_queries):
+    catalog.get_data()
+    with django_assert_num_queries(1):
+        posts = list(Post.objects.all().with_catalog().iterator())
+        assert posts[0].category.title == (
+            post_with_published_location.category.title
+        )
+        assert posts[0].location.name == (
+            post_with_published_location.location.name
+        )
+
+
+def test_unknown_slug_cached(published_category, django_assert_num_queries):
+    catalog.get_data()
+    assert catalog.get_published_category('missing') is None
+    with django_assert_num_queries(0):
+        assert catalog.get_published_category('missing') is None, (
+            'Убедитесь, что неизвестные идентификаторы категорий '
+            'запоминаются в каталоге.'
+        )
@@ -0,0 +1,61 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from blog.constants import NUMBER_OF_COMMENTS
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comment_count_follows_views(
+        user_client, post_with_published_location):
+    post = post_with_published_location
+    assert post.comment_count == 0
+    for _ in range(2):
+        user_client.post(
+            f'/posts/{post.id}/comment/', data={'text': 'Комментарий'}
+        )
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        'Убедитесь, что при добавлении комментария увеличивается '
+        'значение поля `comment_count` публикации.'
+    )
+    comment = Comment.objects.filter(post=post).first()
+    user_client.post(f'/posts/{post.id}/delete_comment/{comment.id}/')
+    post.refresh_from_db()
+    assert post.comment_count == 1, (
+        'Убедитесь, что при удалении комментария уменьшается '
+        'значение поля `comment_count` публикации.'
+    )
+
+
+def test_comment_count_bulk_delete(mixer, post_with_published_location):
+    post = post_with_published_location
+    mixer.cycle(3).blend('blog.Comment', post=post)
+    Comment.objects.filter(post=post).delete()
+    post.refresh_from_db()
+    assert post.comment_count == 0
+
+
+def test_recount_comments_command(mixer, post_with_published_location):
+    post = post_with_published_location
+    mixer.cycle(3).blend('blog.Comment', post=post)
+    Post.objects.update(comment_count=0)
+    call_command('recount_comments', stdout=StringIO())
+    post.refresh_from_db()
+    assert post.comment_count == 3
+
+
+def test_post_detail_paginates_comments(
+        mixer, client, post_with_published_location):
+    post = post_with_published_location
+    mixer.cycle(NUMBER_OF_COMMENTS + 5).blend('blog.Comment', post=post)
+    first_page = client.get(f'/posts/{post.id}/').context['comments']
+    assert len(first_page) == NUMBER_OF_COMMENTS
+    assert first_page.has_next()
+    last_page = client.get(
+        f'/posts/{post.id}/', {'comments_page': 2}
+    ).context['comments']
+    assert len(last_page) == 5
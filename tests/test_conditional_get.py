@@ -0,0 +1,72 @@
+import pytest
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_index_not_modified_without_queries(
+        client, mixer, post_with_published_location,
+        django_assert_num_queries):
+    response = client.get('/')
+    assert response.status_code == 200
+    etag = response['ETag']
+    with django_assert_num_queries(0):
+        cached = client.get('/', HTTP_IF_NONE_MATCH=etag)
+    assert cached.status_code == 304, (
+        'Убедитесь, что лента отвечает 304 на совпадающий If-None-Match.'
+    )
+    mixer.blend(
+        'blog.Post', category=post_with_published_location.category
+    )
+    assert client.get('/', HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+def test_no_validators_for_authenticated_user(
+        client, user_client, user, post_with_published_location):
+    post = post_with_published_location
+    etag = client.get(f'/posts/{post.id}/')['ETag']
+    response = user_client.get(
+        f'/posts/{post.id}/', HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == 200
+    assert 'ETag' not in response, (
+        'Убедитесь, что страницы для авторизованных пользователей '
+        'не отдают ETag: в них встроен CSRF-токен сессии.'
+    )
+    assert 'private' in response['Cache-Control']
+
+
+def test_post_detail_changes_with_comments(
+        client, user_client, post_with_published_location):
+    post = post_with_published_location
+    etag = client.get(f'/posts/{post.id}/')['ETag']
+    assert client.get(
+        f'/posts/{post.id}/', HTTP_IF_NONE_MATCH=etag
+    ).status_code == 304
+    user_client.post(
+        f'/posts/{post.id}/comment/', data={'text': 'Комментарий'}
+    )
+    assert client.get(
+        f'/posts/{post.id}/', HTTP_IF_NONE_MATCH=etag
+    ).status_code == 200, (
+        'Убедитесь, что новый комментарий меняет ETag страницы публикации.'
+    )
+
+
+def test_comment_after_relogin(client, user, post_with_published_location):
+    post = post_with_published_location
+    client.force_login(user)
+    etag = client.get(f'/posts/{post.id}/').get('ETag', '"none"')
+    client.logout()
+    client.force_login(user)
+    client.handler.enforce_csrf_checks = True
+    response = client.get(f'/posts/{post.id}/', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    token = response.context['csrf_token']
+    response = client.post(
+        f'/posts/{post.id}/comment/',
+        data={'text': 'Комментарий', 'csrfmiddlewaretoken': str(token)}
+    )
+    assert response.status_code == 302, (
+        'Убедитесь, что после повторного входа форма комментария '
+        'содержит действующий CSRF-токен.'
+    )
@@ -0,0 +1,57 @@
+import pytest
+from django.core.signals import request_started
+from django.db import connections
+
+from core.connections import pool_stats
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def reset_pool_stats():
+    pool_stats.reset()
+
+
+@pytest.fixture
+def extra_connection(tmp_path):
+    connections.databases['extra'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': str(tmp_path / 'extra.sqlite3'),
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+    }
+    yield connections['extra']
+    connections['extra'].close()
+    del connections['extra']
+    del connections.databases['extra']
+
+
+def test_connection_reused_between_requests(extra_connection):
+    extra_connection.ensure_connection()
+    request_started.send(sender=None)
+    request_started.send(sender=None)
+    totals = pool_stats.snapshot()['totals']['extra']
+    assert totals == {'opened': 1, 'reused': 2, 'discarded': 0}
+
+
+def test_unusable_connection_discarded(extra_connection, monkeypatch):
+    extra_connection.ensure_connection()
+    monkeypatch.setattr(extra_connection, 'is_usable', lambda: False)
+    request_started.send(sender=None)
+    assert extra_connection.connection is None, (
+        'Убедитесь, что неработоспособное соединение закрывается '
+        'перед обработкой запроса.'
+    )
+    assert pool_stats.snapshot()['totals']['extra']['discarded'] == 1
+
+
+def test_connection_stats_endpoint(client, django_user_model):
+    admin = django_user_model.objects.create_user(
+        username='pool_admin', is_staff=True
+    )
+    client.force_login(admin)
+    data = client.get('/metrics/connections/').json()
+    assert data['totals']['default']['reused'] >= 1
+    assert data['threads']
+    client.logout()
+    assert client.get('/metrics/connections/').status_code == 404
@@ -0,0 +1,94 @@
+from datetime import timedelta
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+
+from blog.models import Post
+from blog.paginators import NEXT, PREVIOUS, CursorPaginator
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+cursor_pagination = override_settings(
+    BLOG_CURSOR_PAGINATION=True, BLOG_PAGE_CACHE_TIMEOUT=0
+)
+
+
+@pytest.fixture
+def feed_posts(mixer, user, published_category):
+    now = timezone.now()
+    pub_dates = (
+        now - timedelta(hours=1 + i // 2) for i in range(N_PER_PAGE * 2 + 5)
+    )
+    return mixer.cycle(N_PER_PAGE * 2 + 5).blend(
+        'blog.Post',
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=pub_dates,
+    )
+
+
+def walk(client, url, cursor_attr):
+    ids, cursor, pages = [], '', []
+    while True:
+        response = client.get(url, {'cursor': cursor} if cursor else {})
+        assert response.status_code == 200
+        page = response.context['page_obj']
+        pages.append(page)
+        ids.extend(post.id for post in page)
+        cursor = getattr(page, cursor_attr)
+        if not cursor:
+            return ids, pages
+
+
+@cursor_pagination
+def test_cursor_pagination_walks_whole_feed(client, feed_posts):
+    ids, pages = walk(client, '/', 'next_cursor')
+    expected = sorted(
+        feed_posts, key=lambda post: (post.pub_date, post.id), reverse=True
+    )
+    assert ids == [post.id for post in expected], (
+        'Убедитесь, что курсорная пагинация возвращает все публикации '
+        'в порядке `-pub_date` без пропусков и повторов.'
+    )
+    assert [len(page) for page in pages] == [N_PER_PAGE, N_PER_PAGE, 5]
+
+    last_page = client.get('/', {'cursor': pages[-2].next_cursor})
+    back = client.get(
+        '/', {'cursor': last_page.context['page_obj'].previous_cursor}
+    )
+    assert [post.id for post in back.context['page_obj']] == ids[
+        N_PER_PAGE:N_PER_PAGE * 2
+    ]
+
+
+@cursor_pagination
+def test_cursor_pagination_skips_count(client, feed_posts,
+                                       django_assert_max_num_queries):
+    page = client.get('/').context['page_obj']
+    with django_assert_max_num_queries(1) as captured:
+        client.get('/', {'cursor': page.next_cursor})
+    assert not any(
+        'COUNT(' in query['sql'] for query in captured.captured_queries
+    )
+
+
+@cursor_pagination
+def test_cursor_pagination_rejects_garbage(client, feed_posts):
+    assert client.get('/', {'cursor': 'garbage'}).status_code == 404
+
+
+@cursor_pagination
+def test_cursor_past_either_end_is_not_found(client, feed_posts):
+    paginator = CursorPaginator(Post.objects.filter_posts(), N_PER_PAGE)
+    oldest = min(feed_posts, key=lambda post: (post.pub_date, post.pk))
+    newest = max(feed_posts, key=lambda post: (post.pub_date, post.pk))
+    for cursor in (
+        paginator.encode_cursor(NEXT, oldest),
+        paginator.encode_cursor(PREVIOUS, newest),
+    ):
+        assert client.get('/', {'cursor': cursor}).status_code == 404, (
+            'Убедитесь, что курсор за границей ленты возвращает 404.'
+        )
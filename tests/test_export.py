@@ -0,0 +1,56 @@
+import csv
+import gzip
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_export_posts_jsonl(mixer, post_with_published_location):
+    post = post_with_published_location
+    mixer.blend('blog.Comment', post=post)
+    out = StringIO()
+    call_command('export_blog', 'posts', stdout=out)
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(rows) == 1
+    row = rows[0]
+    assert row['id'] == post.pk
+    assert row['author__username'] == post.author.username
+    assert row['category__slug'] == post.category.slug
+    assert row['location__name'] == post.location.name
+    assert row['comment_count'] == 1
+
+
+def test_export_comments_csv_gzip(tmp_path, mixer):
+    comment = mixer.blend('blog.Comment')
+    path = tmp_path / 'comments.csv.gz'
+    call_command(
+        'export_blog', 'comments', format='csv', gzip=True,
+        output=str(path), chunk_size=1, stdout=StringIO()
+    )
+    with gzip.open(path, 'rt', encoding='utf-8', newline='') as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 1
+    assert rows[0]['text'] == comment.text
+    assert rows[0]['post_id'] == str(comment.post_id)
+
+
+def test_admin_export_action_streams(
+        admin_client, mixer, post_with_published_location):
+    post = post_with_published_location
+    mixer.blend('blog.Post')
+    response = admin_client.post(
+        reverse('admin:blog_post_changelist'),
+        {'action': 'export_jsonl', '_selected_action': [post.pk]}
+    )
+    assert response.status_code == 200
+    assert response.streaming, (
+        'Убедитесь, что выгрузка из админки отдаётся потоково.'
+    )
+    body = gzip.decompress(b''.join(response.streaming_content))
+    rows = [json.loads(line) for line in body.decode().splitlines()]
+    assert [row['id'] for row in rows] == [post.pk]
@@ -0,0 +1,70 @@
+import pytest
+
+pytestmark = [pytest.mark.django_db]
+
+
+def get_feed_urls(post):
+    return [
+        '/feeds/rss/',
+        '/feeds/atom/',
+        f'/category/{post.category.slug}/rss/',
+        f'/category/{post.category.slug}/atom/',
+        f'/profile/{post.author.username}/rss/',
+        f'/profile/{post.author.username}/atom/',
+    ]
+
+
+def test_feeds_contain_excerpt(client, post_with_published_location):
+    post = post_with_published_location
+    post.text = 'Начало. ' + 'очень длинный текст ' * 100 + 'КОНЕЦ'
+    post.save()
+    for url in get_feed_urls(post):
+        response = client.get(url)
+        assert response.status_code == 200, (
+            f'Убедитесь, что лента `{url}` доступна.'
+        )
+        content = response.content.decode()
+        assert post.title in content
+        assert 'Начало.' in content
+        assert 'КОНЕЦ' not in content, (
+            'Убедитесь, что в ленту попадает только начало текста публикации.'
+        )
+    assert 'application/rss+xml' in client.get('/feeds/rss/')['Content-Type']
+    assert 'application/atom+xml' in client.get(
+        '/feeds/atom/'
+    )['Content-Type']
+
+
+def test_feed_conditional_get(
+        client, user_client, mixer, post_with_published_location):
+    post = post_with_published_location
+    url = f'/category/{post.category.slug}/rss/'
+    response = client.get(url)
+    etag = response['ETag']
+    assert user_client.get(url)['ETag'] == etag, (
+        'Убедитесь, что ETag ленты не зависит от пользователя.'
+    )
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    new_post = mixer.blend('blog.Post', category=post.category)
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200, (
+        'Убедитесь, что новая публикация меняет ETag ленты категории.'
+    )
+    assert new_post.title in response.content.decode()
+
+
+def test_feed_hides_unpublished(
+        client, mixer, post_with_published_location, published_category):
+    hidden = mixer.blend(
+        'blog.Post', category=published_category, is_published=False
+    )
+    content = client.get('/feeds/rss/').content.decode()
+    assert post_with_published_location.title in content
+    assert hidden.title not in content
+
+
+def test_feed_not_found(client, mixer):
+    category = mixer.blend('blog.Category', is_published=False)
+    assert client.get(f'/category/{category.slug}/rss/').status_code == 404
+    assert client.get('/category/unknown/atom/').status_code == 404
+    assert client.get('/profile/unknown/rss/').status_code == 404
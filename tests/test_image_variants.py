@@ -0,0 +1,109 @@
+from io import BytesIO, StringIO
+
+import pytest
+from bs4 import BeautifulSoup
+from django.core.files.images import ImageFile
+from django.core.management import call_command
+from PIL import Image
+
+from blog.constants import IMAGE_VARIANT_WIDTHS
+from blog.images import get_variant_name
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def post_with_large_image(mixer, user, published_category):
+    img_io = BytesIO()
+    Image.new('RGB', (2000, 1000), color=(73, 109, 137)).save(
+        img_io, format='JPEG'
+    )
+    return mixer.blend(
+        'blog.Post',
+        author=user,
+        category=published_category,
+        image=ImageFile(img_io, name='large_image.jpg'),
+    )
+
+
+def test_feed_serves_original_until_variants_are_ready(
+        user_client, post_with_large_image):
+    post = post_with_large_image
+    soup = BeautifulSoup(user_client.get('/').content.decode(), 'html.parser')
+    assert soup.find('img', class_='img-thumbnail')['src'] == post.image.url
+    assert soup.find('source') is None
+
+
+def test_feed_serves_resized_variant(user_client, post_with_large_image):
+    post = post_with_large_image
+    call_command('run_tasks', '--once', stdout=StringIO())
+    soup = BeautifulSoup(user_client.get('/').content.decode(), 'html.parser')
+    img = soup.find('img', class_='img-thumbnail')
+    card_width = IMAGE_VARIANT_WIDTHS['card']
+    variant_name = get_variant_name(post.image.name, card_width)
+    assert img['src'] == post.image.storage.url(variant_name), (
+        'Убедитесь, что в карточке публикации выводится уменьшенная копия '
+        'изображения.'
+    )
+    with post.image.storage.open(variant_name) as variant:
+        assert Image.open(variant).width == card_width
+    assert soup.find('source')['srcset']
+
+
+def test_variants_removed_with_image(post_with_large_image):
+    post = post_with_large_image
+    storage = post.image.storage
+    call_command('run_tasks', '--once', stdout=StringIO())
+    old_variant = get_variant_name(
+        post.image.name, IMAGE_VARIANT_WIDTHS['card']
+    )
+    assert storage.exists(old_variant)
+    img_io = BytesIO()
+    Image.new('RGB', (1500, 1000)).save(img_io, format='JPEG')
+    post.image = ImageFile(img_io, name='replaced_image.jpg')
+    post.save()
+    call_command('run_tasks', '--once', stdout=StringIO())
+    assert not storage.exists(old_variant), (
+        'Убедитесь, что уменьшенные копии удаляются при замене изображения.'
+    )
+    new_variant = get_variant_name(
+        post.image.name, IMAGE_VARIANT_WIDTHS['card']
+    )
+    assert storage.exists(new_variant)
+    post.delete()
+    call_command('run_tasks', '--once', stdout=StringIO())
+    assert not storage.exists(new_variant), (
+        'Убедитесь, что уменьшенные копии удаляются вместе с публикацией.'
+    )
+
+
+def test_narrow_image_is_not_upscaled(
+        user_client, mixer, user, published_category):
+    img_io = BytesIO()
+    Image.new('RGB', (800, 600)).save(img_io, format='JPEG')
+    post = mixer.blend(
+        'blog.Post',
+        author=user,
+        category=published_category,
+        image=ImageFile(img_io, name='narrow_image.jpg'),
+    )
+    call_command('run_tasks', '--once', stdout=StringIO())
+    storage = post.image.storage
+    assert storage.exists(get_variant_name(post.image.name, 640))
+    assert not storage.exists(get_variant_name(post.image.name, 960)), (
+        'Убедитесь, что копии шире оригинала не создаются.'
+    )
+    soup = BeautifulSoup(
+        user_client.get(f'/posts/{post.id}/').content.decode(),
+        'html.parser'
+    )
+    srcset = soup.find('source')['srcset'].split(', ')
+    assert srcset == [
+        f'{storage.url(get_variant_name(post.image.name, 320))} 320w',
+        f'{storage.url(get_variant_name(post.image.name, 640))} 640w',
+        f'{post.image.url} 800w',
+    ], (
+        'Убедитесь, что srcset узкого изображения состоит из готовых '
+        'копий и оригинала с его настоящей шириной.'
+    )
+    assert soup.find('img', class_='img-thumbnail')['src'] == post.image.url
@@ -0,0 +1,29 @@
+import pytest
+from django.db import connection
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.mark.skipif(
+    connection.vendor != 'sqlite', reason='План запроса проверяется на SQLite'
+)
+@pytest.mark.parametrize(
+    ('queryset', 'index_name'),
+    [
+        (lambda: Post.objects.get_comments_count().filter_posts()[:10],
+         'post_visible_feed_idx'),
+        (lambda: Post.objects.filter(author_id=1).order_by('-pub_date')[:10],
+         'post_author_pub_date_idx'),
+        (lambda: Comment.objects.filter(post_id=1).order_by('created_at'),
+         'comment_post_created_at_idx'),
+    ],
+    ids=['feed', 'profile', 'comments'],
+)
+def test_query_uses_index(queryset, index_name):
+    plan = queryset().explain()
+    assert index_name in plan, (
+        f'Убедитесь, что запрос использует индекс `{index_name}`. '
+        f'План запроса:\n{plan}'
+    )
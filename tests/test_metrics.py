@@ -0,0 +1,45 @@
+import logging
+
+import pytest
+from django.test import override_settings
+
+from metrics.middleware import stats
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    stats.reset()
+
+
+@pytest.fixture
+def admin_client(client, django_user_model):
+    admin = django_user_model.objects.create_user(
+        username='metrics_admin', is_staff=True
+    )
+    client.force_login(admin)
+    return client
+
+
+def test_server_timing_header(user_client, post_with_published_location):
+    response = user_client.get('/')
+    assert 'db;dur=' in response['Server-Timing']
+    assert 'render;dur=' in response['Server-Timing']
+    assert 'total;dur=' in response['Server-Timing']
+
+
+def test_stats_endpoint(admin_client, user_client):
+    admin_client.get('/')
+    admin_client.get('/')
+    data = admin_client.get('/metrics/').json()
+    assert data['blog:index']['requests'] == 2
+    assert set(data['blog:index']['queries']) == {'p50', 'p95', 'p99'}
+    assert user_client.get('/metrics/').status_code == 404
+
+
+@override_settings(METRICS_BUDGETS={'blog:index': {'queries': 0}})
+def test_budget_violation_is_logged(user_client, caplog):
+    with caplog.at_level(logging.WARNING, logger='metrics'):
+        user_client.get('/')
+    assert 'blog:index' in caplog.text
@@ -0,0 +1,97 @@
+import pytest
+
+from blog.templatetags import blog_tags
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_anonymous_pages_are_cached(
+        client, post_with_published_location, django_assert_num_queries):
+    post = post_with_published_location
+    urls = (
+        '/',
+        f'/posts/{post.id}/',
+        f'/category/{post.category.slug}/',
+        f'/profile/{post.author.username}/',
+    )
+    for url in urls:
+        first = client.get(url)
+        with django_assert_num_queries(0):
+            second = client.get(url)
+        assert first.content == second.content, (
+            f'Убедитесь, что страница `{url}` для анонимных пользователей '
+            'отдаётся из кэша.'
+        )
+
+
+def test_logged_in_pages_are_not_cached(
+        user_client, post_with_published_location):
+    user_client.get('/')
+    response = user_client.get('/')
+    assert response.context is not None
+
+
+def test_comment_invalidates_post_pages(
+        client, mixer, post_with_published_location, another_category):
+    post = post_with_published_location
+    other_post = mixer.blend(
+        'blog.Post', category=another_category, author=post.author
+    )
+    detail_url = f'/posts/{post.id}/'
+    other_category_url = f'/category/{another_category.slug}/'
+    client.get(detail_url)
+    client.get(other_category_url)
+
+    mixer.blend('blog.Comment', post=post, text='Свежий комментарий')
+    assert 'Свежий комментарий' in client.get(detail_url).content.decode(), (
+        'Убедитесь, что добавление комментария сбрасывает кэш страницы '
+        'публикации.'
+    )
+    assert client.get(other_category_url).context is None, (
+        'Убедитесь, что комментарий к публикации не сбрасывает кэш '
+        'страниц, на которых она не показывается.'
+    )
+    assert other_post.id != post.id
+
+
+def test_post_move_invalidates_old_category(
+        client, post_with_published_location, another_category):
+    post = post_with_published_location
+    old_category_url = f'/category/{post.category.slug}/'
+    assert post.title in client.get(old_category_url).content.decode()
+    post.category = another_category
+    post.save()
+    assert post.title not in client.get(old_category_url).content.decode()
+
+
+def test_post_card_fragment_follows_updates(
+        user_client, post_with_published_location):
+    post = post_with_published_location
+    assert post.title in user_client.get('/').content.decode()
+    post.title = 'Обновлённый заголовок'
+    post.save()
+    assert 'Обновлённый заголовок' in user_client.get('/').content.decode(), (
+        'Убедитесь, что кэш карточки публикации сбрасывается при её '
+        'изменении.'
+    )
+    post.category.title = 'Новая категория'
+    post.category.save()
+    assert 'Новая категория' in user_client.get('/').content.decode()
+
+
+def test_site_version_resolved_once_per_page(
+        mixer, user_client, post_with_published_location, monkeypatch):
+    mixer.cycle(3).blend(
+        'blog.Post', category=post_with_published_location.category
+    )
+    calls = []
+    get_tag_versions = blog_tags.get_tag_versions
+    monkeypatch.setattr(
+        blog_tags, 'get_tag_versions',
+        lambda tags: calls.append(tags) or get_tag_versions(tags)
+    )
+    user_client.get('/')
+    assert len(calls) == 1, (
+        'Убедитесь, что версия сайта для ключей карточек запрашивается '
+        'один раз на страницу.'
+    )
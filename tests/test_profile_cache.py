@@ -0,0 +1,55 @@
+import pytest
+
+from blog.profiles import get_profile
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_profile_is_read_through(user, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        profile = get_profile(user.username)
+    assert profile == user
+    with django_assert_num_queries(0):
+        assert get_profile(user.username).username == user.username
+
+
+def test_missing_profile_is_cached(client, django_assert_num_queries):
+    assert client.get('/profile/nobody_here/').status_code == 404
+    with django_assert_num_queries(0):
+        assert client.get('/profile/nobody_here/').status_code == 404, (
+            'Убедитесь, что несуществующие имена пользователей кешируются.'
+        )
+
+
+def test_new_user_clears_missing_entry(django_user_model):
+    assert get_profile('late_user') is None
+    django_user_model.objects.create_user(username='late_user')
+    assert get_profile('late_user') is not None
+
+
+def test_username_change_invalidates_profile(user, user_client):
+    old_username = user.username
+    assert get_profile(old_username) is not None
+    response = user_client.post(
+        f'/profile/{old_username}/edit/',
+        data={
+            'first_name': 'Имя', 'last_name': 'Фамилия',
+            'username': 'renamed_user', 'email': 'renamed@example.com',
+        }
+    )
+    assert response.status_code == 302
+    assert get_profile(old_username) is None
+    assert get_profile('renamed_user').first_name == 'Имя'
+    assert user_client.get(f'/profile/{old_username}/').status_code == 404
+
+
+def test_rename_outside_views_invalidates_old_username(user):
+    old_username = user.username
+    assert get_profile(old_username) is not None
+    user.username = 'renamed_in_admin'
+    user.save()
+    assert get_profile(old_username) is None, (
+        'Убедитесь, что при переименовании пользователя сбрасывается кеш '
+        'профиля по старому имени.'
+    )
+    assert get_profile('renamed_in_admin') is not None
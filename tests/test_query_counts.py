@@ -0,0 +1,77 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.catalog import catalog
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def warm_catalog(post_with_published_location):
+    catalog.get_data()
+
+
+def test_post_detail_queries(
+        mixer, client, user_client, post_with_published_location,
+        warm_catalog, django_assert_num_queries):
+    post = post_with_published_location
+    with django_assert_num_queries(1):
+        client.get(f'/posts/{post.id}/')
+    mixer.cycle(5).blend('blog.Comment', post=post)
+    with django_assert_num_queries(2):
+        client.get(f'/posts/{post.id}/')
+    with django_assert_num_queries(4):
+        user_client.get(f'/posts/{post.id}/')
+
+
+def test_post_edit_queries(
+        user_client, post_with_published_location,
+        django_assert_num_queries):
+    post = post_with_published_location
+    with django_assert_num_queries(5):
+        user_client.get(f'/posts/{post.id}/edit/')
+    with django_assert_num_queries(3):
+        user_client.get(f'/posts/{post.id}/delete/')
+
+
+def test_comment_edit_queries(
+        mixer, user, user_client, post_with_published_location,
+        django_assert_num_queries):
+    post = post_with_published_location
+    comment = mixer.blend('blog.Comment', post=post, author=user)
+    with django_assert_num_queries(3):
+        user_client.get(f'/posts/{post.id}/edit_comment/{comment.id}/')
+    with django_assert_num_queries(3):
+        user_client.get(f'/posts/{post.id}/delete_comment/{comment.id}/')
+
+
+def test_feed_reads_catalog_from_memory(
+        client, post_with_published_location, warm_catalog):
+    post = post_with_published_location
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get('/')
+    assert post.category.title in response.content.decode()
+    assert post.location.name in response.content.decode()
+    for query in queries.captured_queries:
+        assert 'blog_category' not in query['sql'], (
+            'Убедитесь, что категории публикаций берутся из каталога '
+            'в памяти.'
+        )
+        assert 'blog_location' not in query['sql']
+
+
+def test_category_page_queries(
+        client, post_with_published_location, warm_catalog,
+        django_assert_num_queries):
+    slug = post_with_published_location.category.slug
+    with django_assert_num_queries(2):
+        client.get(f'/category/{slug}/')
+
+
+def test_profile_page_queries(
+        client, user_client, user, post_with_published_location,
+        warm_catalog, django_assert_num_queries):
+    client.get(f'/profile/{user.username}/')
+    with django_assert_num_queries(4):
+        user_client.get(f'/profile/{user.username}/')
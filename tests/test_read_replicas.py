@@ -0,0 +1,81 @@
+import sqlite3
+from datetime import timedelta
+
+import pytest
+from django.db import connections
+from django.test import override_settings
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db(transaction=True)]
+
+
+@pytest.fixture
+def published_post(mixer, user, published_category):
+    return mixer.blend(
+        'blog.Post', title='Публикация из реплики', author=user,
+        category=published_category, location=None, is_published=True,
+        pub_date=timezone.now() - timedelta(hours=1)
+    )
+
+
+@pytest.fixture
+def replica(tmp_path, published_post):
+    path = tmp_path / 'replica.sqlite3'
+    connections['default'].ensure_connection()
+    target = sqlite3.connect(path)
+    connections['default'].connection.backup(target)
+    target.close()
+    connections.databases['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': str(path),
+    }
+    with override_settings(
+        READ_REPLICAS=['replica'], BLOG_PAGE_CACHE_TIMEOUT=0
+    ):
+        yield 'replica'
+    connections['replica'].close()
+    del connections['replica']
+    del connections.databases['replica']
+
+
+@pytest.fixture
+def lagging_post(replica, mixer, user, published_category):
+    return mixer.blend(
+        'blog.Post', title='Публикация только в основной базе',
+        author=user, category=published_category, location=None,
+        is_published=True, pub_date=timezone.now() - timedelta(hours=1)
+    )
+
+
+def test_read_views_use_replica(client, published_post, lagging_post):
+    content = client.get('/').content.decode()
+    assert published_post.title in content
+    assert lagging_post.title not in content, (
+        'Убедитесь, что главная страница читает данные из реплики.'
+    )
+    assert client.get(f'/posts/{lagging_post.id}/').status_code == 404
+
+
+def test_writer_reads_own_writes(
+        user_client, published_post, lagging_post):
+    assert lagging_post.title not in user_client.get('/').content.decode()
+    response = user_client.post(
+        f'/posts/{published_post.id}/comment/', data={'text': 'Комментарий'}
+    )
+    assert response.status_code == 302
+    assert 'read_primary' in response.cookies, (
+        'Убедитесь, что после записи пользователь закрепляется '
+        'за основной базой.'
+    )
+    content = user_client.get('/').content.decode()
+    assert lagging_post.title in content, (
+        'Убедитесь, что после записи автор читает данные из основной базы.'
+    )
+
+
+def test_writes_go_to_primary(user_client, published_post, replica):
+    user_client.post(
+        f'/posts/{published_post.id}/comment/', data={'text': 'Комментарий'}
+    )
+    assert published_post.comments.using('default').count() == 1
+    assert published_post.comments.using('replica').count() == 0
@@ -0,0 +1,56 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_scheduled_post_goes_live(client, mixer, user, published_category):
+    post = mixer.blend(
+        'blog.Post',
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=timezone.now() + timedelta(hours=1),
+    )
+    assert not post.is_visible
+    assert post.title not in client.get('/').content.decode()
+
+    Post.objects.filter(pk=post.pk).update(
+        pub_date=timezone.now() - timedelta(minutes=1)
+    )
+    call_command('publish_scheduled', stdout=StringIO())
+    post.refresh_from_db()
+    assert post.is_visible
+    assert post.title in client.get('/').content.decode(), (
+        'Убедитесь, что после запуска `publish_scheduled` отложенная '
+        'публикация появляется в ленте.'
+    )
+
+
+def test_unpublished_category_hides_posts(post_with_published_location):
+    post = post_with_published_location
+    assert post.is_visible
+    post.category.is_published = False
+    post.category.save()
+    post.refresh_from_db()
+    assert not post.is_visible
+
+
+def test_deleted_category_hides_posts(client, post_with_published_location):
+    post = post_with_published_location
+    assert post.title in client.get('/').content.decode()
+    post.category.delete()
+    post.refresh_from_db()
+    assert post.category is None
+    assert not post.is_visible
+    response = client.get('/')
+    assert response.status_code == 200, (
+        'Убедитесь, что лента открывается после удаления категории.'
+    )
+    assert post.title not in response.content.decode()
@@ -0,0 +1,115 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import connection
+from django.test import override_settings
+from django.utils import timezone
+
+from blog.search import (
+    InvertedIndexBackend, fts5_available, fts5_tables, stem, tokenize
+)
+from tasks.models import Task
+
+pytestmark = [pytest.mark.django_db]
+
+BACKENDS = (
+    'blog.search.FTS5Backend',
+    'blog.search.InvertedIndexBackend',
+)
+
+
+def test_russian_stemming():
+    assert stem('книги') == stem('книгу') == stem('книга')
+    assert tokenize('Ёлки, ПАЛКИ и Django!') == ['елк', 'палк', 'django']
+
+
+@pytest.fixture
+def search_posts(mixer, user, published_category):
+    def make(title, text, is_published=True):
+        return mixer.blend(
+            'blog.Post',
+            author=user,
+            category=published_category,
+            is_published=is_published,
+            pub_date=timezone.now() - timedelta(days=1),
+            title=title,
+            text=text,
+        )
+    return {
+        'title': make('Новые книги', 'Обзор за неделю'),
+        'text': make('Обзор', 'Прочитал интересную книгу о путешествиях'),
+        'hidden': make('Черновик про книгу', 'Текст', is_published=False),
+        'other': make('Кулинария', 'Рецепт пирога'),
+    }
+
+
+def found_titles(client, query):
+    response = client.get('/search/', {'q': query})
+    assert response.status_code == 200
+    return [post.title for post in response.context['page_obj']]
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_search_ranks_and_respects_visibility(client, search_posts, backend):
+    with override_settings(BLOG_SEARCH_BACKEND=backend):
+        call_command('run_tasks', '--once', stdout=StringIO())
+        assert found_titles(client, 'книга') == ['Новые книги', 'Обзор'], (
+            'Убедитесь, что поиск учитывает словоформы, ставит совпадения '
+            'в заголовке выше и не показывает скрытые публикации.'
+        )
+        assert found_titles(client, 'книга пирог') == []
+        search_posts['title'].delete()
+        assert found_titles(client, 'книги') == ['Обзор']
+
+
+def test_search_without_query(client):
+    assert found_titles(client, '') == []
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_rebuild_search_index(client, search_posts, backend):
+    with override_settings(BLOG_SEARCH_BACKEND=backend):
+        call_command('rebuild_search_index', stdout=StringIO())
+        assert found_titles(client, 'книги') == ['Новые книги', 'Обзор']
+
+
+def test_post_is_indexed_in_background(client, search_posts):
+    post = search_posts['other']
+    assert Task.objects.filter(
+        name='blog.tasks.index_post', args=[post.pk]
+    ).exists()
+    assert found_titles(client, 'пирог') == [], (
+        'Убедитесь, что публикация индексируется фоновой задачей, '
+        'а не при сохранении.'
+    )
+    call_command('run_tasks', '--once', stdout=StringIO())
+    assert found_titles(client, 'пирог') == ['Кулинария']
+    post.save()
+    assert not Task.objects.filter(
+        name='blog.tasks.index_post', status=Task.PENDING
+    ).exists(), (
+        'Убедитесь, что публикация не переиндексируется, если её текст '
+        'не менялся.'
+    )
+
+
+@override_settings(BLOG_SEARCH_BACKEND='blog.search.InvertedIndexBackend')
+def test_idf_uses_number_of_indexed_posts(mixer, search_posts):
+    backend = InvertedIndexBackend()
+    call_command('rebuild_search_index', stdout=StringIO())
+    assert backend.count_documents() == len(search_posts)
+    mixer.cycle(3).blend('blog.Post')[-1].delete()
+    assert backend.count_documents() == len(search_posts), (
+        'Убедитесь, что для IDF считается число проиндексированных '
+        'публикаций.'
+    )
+
+
+def test_fts5_check_is_reset_after_migrate():
+    available = fts5_available()
+    fts5_tables[connection.settings_dict['NAME']] = not available
+    emit_post_migrate_signal(0, False, connection.alias)
+    assert fts5_available() == available
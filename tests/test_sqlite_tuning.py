@@ -0,0 +1,47 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connections
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def file_connection(tmp_path):
+    connections.databases['tuned'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': str(tmp_path / 'tuned.sqlite3'),
+    }
+    yield connections['tuned']
+    connections['tuned'].close()
+    del connections['tuned']
+    del connections.databases['tuned']
+
+
+def test_pragmas_applied_on_connect(file_connection, settings):
+    with file_connection.cursor() as cursor:
+        values = {}
+        for name in settings.SQLITE_PRAGMAS:
+            cursor.execute(f'PRAGMA {name}')
+            values[name] = cursor.fetchone()[0]
+    assert values['journal_mode'] == 'wal', (
+        'Убедитесь, что для SQLite включён режим журнала WAL.'
+    )
+    assert values['busy_timeout'] == settings.SQLITE_PRAGMAS['busy_timeout']
+    assert values['synchronous'] == 1
+    assert values['temp_store'] == 2
+
+
+def test_benchmark_sqlite_reports_both_modes(tmp_path):
+    output = tmp_path / 'sqlite.json'
+    call_command(
+        'benchmark_sqlite', readers=1, writers=1, duration=0.2, posts=5,
+        output=str(output), stdout=StringIO()
+    )
+    results = json.loads(output.read_text(encoding='utf-8'))
+    assert set(results) == {'default', 'tuned'}
+    for result in results.values():
+        assert result['reads_per_second'] > 0
+        assert result['writes_per_second'] > 0
@@ -0,0 +1,59 @@
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+
+from blog.models import Category, Comment, Post
+from blog.streaming import iter_json_array
+
+pytestmark = [pytest.mark.django_db(transaction=True)]
+
+DB_JSON = Path(__file__).resolve().parent.parent / 'db.json'
+
+
+def test_iter_json_array_small_chunks(tmp_path):
+    items = [{'model': 'blog.category', 'pk': i, 'text': 'ё' * i}
+             for i in range(1, 20)]
+    path = tmp_path / 'items.json'
+    path.write_text(json.dumps(items, ensure_ascii=False), encoding='utf-8')
+    assert list(iter_json_array(path, chunk_size=7)) == items
+
+
+def test_stream_loaddata_repo_fixture():
+    call_command('stream_loaddata', str(DB_JSON), batch_size=10,
+                 exclude=['admin', 'auth.permission'], stdout=StringIO())
+    expected = json.loads(DB_JSON.read_text(encoding='utf-8'))
+    posts = [item for item in expected if item['model'] == 'blog.post']
+    assert Post.objects.count() == len(posts)
+    first = Post.objects.get(pk=posts[0]['pk'])
+    assert first.created_at.isoformat().startswith(
+        posts[0]['fields']['created_at'][:19]
+    ), 'Убедитесь, что загрузчик сохраняет исходные значения `created_at`.'
+    assert Post.objects.filter_posts().exists()
+
+
+def test_stream_loaddata_orders_dependencies(tmp_path, user):
+    fixture = [
+        {'model': 'blog.comment', 'pk': 1, 'fields': {
+            'text': 'Комментарий', 'post': 1, 'author': user.pk,
+            'created_at': '2023-01-01T00:00:00Z'}},
+        {'model': 'blog.post', 'pk': 1, 'fields': {
+            'title': 'Пост', 'text': 'Текст', 'author': user.pk,
+            'category': 1, 'location': None, 'is_published': True,
+            'pub_date': '2023-01-01T00:00:00Z',
+            'created_at': '2023-01-01T00:00:00Z', 'image': ''}},
+        {'model': 'blog.category', 'pk': 1, 'fields': {
+            'title': 'Категория', 'description': 'Описание',
+            'slug': 'stream', 'is_published': True,
+            'created_at': '2023-01-01T00:00:00Z'}},
+    ]
+    path = tmp_path / 'fixture.json'
+    path.write_text(json.dumps(fixture), encoding='utf-8')
+    call_command('stream_loaddata', str(path), stdout=StringIO())
+    assert Category.objects.filter(slug='stream').exists()
+    assert Comment.objects.count() == 1
+    post = Post.objects.get(pk=1)
+    assert post.comment_count == 1
+    assert post.is_visible
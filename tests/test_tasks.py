@@ -0,0 +1,89 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from tasks.backends import enqueue
+from tasks.models import Task
+
+pytestmark = [pytest.mark.django_db]
+
+CALLS = []
+
+
+def remember_call(*args):
+    CALLS.append(args)
+
+
+def always_fail():
+    raise ValueError('Ошибка задачи')
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    CALLS.clear()
+
+
+def test_database_backend_defers_work():
+    task = enqueue('test_tasks.remember_call', 1, 'a')
+    assert task.status == Task.PENDING
+    assert CALLS == [], (
+        'Убедитесь, что задача не выполняется до запуска обработчика '
+        'очереди.'
+    )
+    call_command('run_tasks', '--once', stdout=StringIO())
+    task.refresh_from_db()
+    assert task.status == Task.DONE
+    assert CALLS == [(1, 'a')]
+
+
+@override_settings(TASKS_MAX_ATTEMPTS=2)
+def test_failed_task_is_retried_then_marked_failed():
+    task = enqueue('test_tasks.always_fail')
+    call_command('run_tasks', '--once', stdout=StringIO())
+    task.refresh_from_db()
+    assert task.status == Task.FAILED
+    assert task.attempts == 2
+    assert 'Ошибка задачи' in task.error
+
+
+@override_settings(TASKS_BACKEND='tasks.backends.ImmediateBackend')
+def test_immediate_backend_runs_inline():
+    enqueue('test_tasks.remember_call', 2)
+    assert CALLS == [(2,)]
+    assert not Task.objects.exists()
+
+
+def test_post_image_upload_is_queued(post_with_published_location):
+    assert Task.objects.filter(
+        name='blog.tasks.make_image_variants',
+        args=[post_with_published_location.pk],
+    ).exists()
+
+
+@override_settings(TASKS_MAX_ATTEMPTS=2)
+def test_stale_running_task_is_released():
+    task = enqueue('test_tasks.remember_call', 3)
+    assert task.claim()
+    Task.objects.filter(pk=task.pk).update(
+        started_at=timezone.now() - timedelta(hours=1)
+    )
+    call_command('run_tasks', '--once', stdout=StringIO())
+    task.refresh_from_db()
+    assert task.status == Task.DONE, (
+        'Убедитесь, что задача упавшего обработчика возвращается в очередь.'
+    )
+    assert CALLS == [(3,)]
+
+    task = enqueue('test_tasks.remember_call', 4)
+    task.claim()
+    Task.objects.filter(pk=task.pk).update(
+        attempts=2, started_at=timezone.now() - timedelta(hours=1)
+    )
+    call_command('run_tasks', '--once', stdout=StringIO())
+    task.refresh_from_db()
+    assert task.status == Task.FAILED
+    assert task.error